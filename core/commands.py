@@ -31,4 +31,17 @@ class Environment(Enum):
     CompileModSources = auto()
     DeleteModSources = auto()
 
+    Shutdown = auto()
+
     Notification = auto()
+
+
+def PackEnv(env: Environment, args) -> tuple:
+    # Wire format of sendEnv: the small int value pickles much smaller than the enum member
+    return (env.value, *args)
+
+
+def UnpackEnv(data):
+    if isinstance(data, tuple) and data:
+        return [Environment(data[0]), *data[1:]]
+    return data
@@ -0,0 +1,271 @@
+import os
+import queue
+import ctypes
+import pickle
+import struct
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+
+
+# Default arena size of one channel direction
+CHANNEL_SIZE = 2 ** 23
+# Bytes payloads from this size are sent out-of-band
+OUT_OF_BAND_THRESHOLD = 2 ** 16
+
+# Frame header: whole frame length, pickled header length, out-of-band buffers count
+_FRAME_HEADER = struct.Struct("<QII")
+# Buffer lengths structs for the usual small buffers counts
+_BUFFER_LENGTHS = {count: struct.Struct(f"<{count}Q") for count in range(4)}
+# Sleep between checks while the ring is full (producer) or a streamed frame is pending (consumer)
+_WAIT_INTERVAL = 0.001
+
+
+def OutOfBand(args: tuple) -> tuple:
+    """Wrap large ``bytes`` arguments in ``PickleBuffer`` so they skip the in-band pickle copy"""
+    return tuple(pickle.PickleBuffer(arg)
+                 if isinstance(arg, bytes) and len(arg) >= OUT_OF_BAND_THRESHOLD else arg
+                 for arg in args)
+
+
+def _bufferLengths(count: int) -> struct.Struct:
+    lengths = _BUFFER_LENGTHS.get(count)
+    return struct.Struct(f"<{count}Q") if lengths is None else lengths
+
+
+class ShmChannel:
+    """
+    Multi-producer / single-consumer message channel over a shared memory ring buffer.
+
+    Ring layout is a plain byte stream; ``head``/``tail`` are monotonic byte counters
+    (position in arena is ``counter % size``). Every message is framed as
+    ``[frame length | pickle length | buffers count | buffer lengths... | pickle | buffers...]``,
+    pickled with protocol 5 so out-of-band buffers are copied straight into the arena.
+
+    ``tail`` is only written by the producer holding the write lock and ``head`` only by
+    the consumer holding the read lock; a stale read of the other side's counter can only
+    under-estimate free or available space. A message that fits the arena is copied in
+    one piece and ``tail`` is published before the message is counted on the semaphore,
+    so the consumer never sees a partial frame. Messages larger than the arena are
+    streamed through it: the first arena-full, header included, is published before the
+    message is counted and the consumer drains the rest while it is written. Such a
+    ``put`` needs a consumer, so it raises ``queue.Full`` when ``block`` is false.
+
+    Mirrors the ``multiprocessing.Queue`` api used by controller and dispatch
+    (``put``/``get``/``empty``), so both sides can share it; ``poll`` waits for a message
+    without consuming it. ``put_many`` writes a batch of messages as one block.
+    Unlike ``multiprocessing.Queue`` the channel is bounded: a full channel blocks
+    ``put``, or raises ``queue.Full`` when ``block`` is false or ``timeout`` expires.
+    """
+
+    def __init__(self, size: int = CHANNEL_SIZE):
+        self._size = size
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._ownerPid = os.getpid()
+
+        self._head = multiprocessing.RawValue(ctypes.c_uint64, 0)
+        self._tail = multiprocessing.RawValue(ctypes.c_uint64, 0)
+
+        self._messages = multiprocessing.Semaphore(0)
+        self._writeLock = multiprocessing.Lock()
+        self._readLock = multiprocessing.Lock()
+
+    def __getstate__(self):
+        return {"_size": self._size,
+                "_shmName": self._shm.name,
+                "_ownerPid": self._ownerPid,
+                "_head": self._head,
+                "_tail": self._tail,
+                "_messages": self._messages,
+                "_writeLock": self._writeLock,
+                "_readLock": self._readLock}
+
+    def __setstate__(self, state):
+        self._shm = shared_memory.SharedMemory(name=state.pop("_shmName"))
+        self.__dict__.update(state)
+
+    # Queue api
+    def empty(self) -> bool:
+        return not self.poll(0)
+
+    def poll(self, timeout: float = 0) -> bool:
+        """Check for pending message, waiting up to ``timeout`` seconds (``None`` - forever)"""
+        if not self._messages.acquire(timeout != 0, timeout):
+            return False
+
+        # Single consumer, so the message is still there for the following ``get``
+        self._messages.release()
+        return True
+
+    def put(self, obj, block=True, timeout=None):
+        frame = self._frame(obj)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        if not self._writeLock.acquire(block, timeout):
+            raise queue.Full
+        try:
+            self._put(frame, 1, block, deadline)
+        finally:
+            self._writeLock.release()
+
+    def put_many(self, objs, block=True, timeout=None):
+        # Frames are built before taking the lock
+        frames = [self._frame(obj) for obj in objs]
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        if not self._writeLock.acquire(block, timeout):
+            raise queue.Full
+        try:
+            if sum(map(len, frames)) <= self._size:
+                self._put(b"".join(frames), len(frames), block, deadline)
+            else:
+                for frame in frames:
+                    self._put(frame, 1, block, deadline)
+        finally:
+            self._writeLock.release()
+
+    def get(self, block=True, timeout=None):
+        if not self._messages.acquire(block, timeout):
+            raise queue.Empty
+
+        with self._readLock:
+            head = self._head.value
+            length, headerLength, buffersCount = _FRAME_HEADER.unpack(self._copy(head, _FRAME_HEADER.size))
+
+            if length <= self._size:
+                # Whole frame was published before the message was counted
+                frame = self._copy(head, length)
+                self._head.value = head + length
+            else:
+                frame = self._receive(head, length)
+
+        # Buffers are copied out as ``bytes``, so read-only ``PickleBuffer`` payloads load back as ``bytes``
+        lengths = _bufferLengths(buffersCount)
+        offset = _FRAME_HEADER.size + lengths.size
+        view = memoryview(frame)
+        header = view[offset:offset + headerLength]
+        offset += headerLength
+
+        buffers = []
+        for bufferLength in lengths.unpack_from(frame, _FRAME_HEADER.size):
+            buffers.append(bytes(view[offset:offset + bufferLength]))
+            offset += bufferLength
+
+        return pickle.loads(header, buffers=buffers)
+
+    def close(self):
+        self._shm.close()
+        if os.getpid() == self._ownerPid:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    # Ring
+    @staticmethod
+    def _frame(obj) -> bytes:
+        buffers = []
+        header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        if not buffers:
+            return _FRAME_HEADER.pack(_FRAME_HEADER.size + len(header), len(header), 0) + header
+
+        raws = [buffer.raw() for buffer in buffers]
+        lengths = _bufferLengths(len(raws))
+        length = _FRAME_HEADER.size + lengths.size + len(header) + sum(raw.nbytes for raw in raws)
+
+        return b"".join([_FRAME_HEADER.pack(length, len(header), len(raws)),
+                         lengths.pack(*(raw.nbytes for raw in raws)),
+                         header,
+                         *raws])
+
+    def _put(self, frame: bytes, count: int, block: bool, deadline):
+        length = len(frame)
+        if length > self._size:
+            self._stream(frame, block, deadline)
+            return
+
+        tail = self._tail.value
+        while self._size - (tail - self._head.value) < length:
+            self._wait(block, deadline)
+
+        # Region [tail, head + size) belongs only to the producer holding the write lock
+        self._paste(tail, frame)
+        self._tail.value = tail + length
+
+        for _ in range(count):
+            self._messages.release()
+
+    def _stream(self, frame: bytes, block: bool, deadline):
+        # A frame larger than the arena completes only while the consumer drains it
+        if not block:
+            raise queue.Full
+
+        start = self._tail.value
+        while start != self._head.value:
+            self._wait(block, deadline)
+
+        # First arena-full, with the frame header, is published before the message is counted
+        view = memoryview(frame)
+        self._paste(start, view[:self._size])
+        self._tail.value = tail = start + self._size
+        self._messages.release()
+
+        # Until the consumer takes the message it can be withdrawn on timeout, after that it is drained
+        while self._head.value == start:
+            if deadline is not None and time.monotonic() >= deadline and self._messages.acquire(False):
+                self._tail.value = start
+                raise queue.Full
+            time.sleep(_WAIT_INTERVAL)
+
+        offset = self._size
+        while offset < len(view):
+            free = self._size - (tail - self._head.value)
+            if free == 0:
+                time.sleep(_WAIT_INTERVAL)
+                continue
+
+            count = min(free, len(view) - offset)
+            self._paste(tail, view[offset:offset + count])
+            offset += count
+            tail += count
+            self._tail.value = tail
+
+    def _receive(self, head: int, length: int) -> bytearray:
+        frame = bytearray()
+
+        while len(frame) < length:
+            available = self._tail.value - head
+            if available == 0:
+                time.sleep(_WAIT_INTERVAL)
+                continue
+
+            count = min(available, length - len(frame))
+            frame += self._copy(head, count)
+            head += count
+            self._head.value = head
+
+        return frame
+
+    @staticmethod
+    def _wait(block: bool, deadline):
+        if not block or (deadline is not None and time.monotonic() >= deadline):
+            raise queue.Full
+        time.sleep(_WAIT_INTERVAL)
+
+    def _paste(self, counter: int, data):
+        position = counter % self._size
+        first = self._size - position
+
+        if len(data) <= first:
+            self._shm.buf[position:position + len(data)] = data
+        else:
+            self._shm.buf[position:] = data[:first]
+            self._shm.buf[:len(data) - first] = data[first:]
+
+    def _copy(self, counter: int, length: int) -> bytes:
+        position = counter % self._size
+        first = self._size - position
+
+        if length <= first:
+            return self._shm.buf[position:position + length].tobytes()
+        return self._shm.buf[position:].tobytes() + self._shm.buf[:length - first].tobytes()
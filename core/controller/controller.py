@@ -1,26 +1,109 @@
 import multiprocessing
+import threading
+import ctypes
+import atexit
+import queue
+import io
 import sys
 import os
+from multiprocessing import shared_memory
 
-from ..commands import Environment
+from .channel import ShmChannel, OutOfBand
+from ..commands import Environment, PackEnv, UnpackEnv
 from ..notifications import Notification
 
 
-def run_server_process(recv_queue: multiprocessing.Queue, send_queue: multiprocessing.Queue):
-    # Define a log file path.
-    log_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'worker_error.log'))
+# How long send waits on a full channel before checking the worker is still alive
+SEND_TIMEOUT = 0.5
+
+
+class RingLog(io.TextIOBase):
+    """
+    Text stream keeping the last ``size`` bytes written in shared memory.
+    The worker writes its output there and the controller can still read it after
+    the worker died, without every print being a disk write.
+    """
+
+    def __init__(self, size: int = 2 ** 20):
+        self._size = size
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._ownerPid = os.getpid()
+        # Total bytes ever written, position in the arena is ``written % size``
+        self._written = multiprocessing.RawValue(ctypes.c_uint64, 0)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"_size": self._size,
+                "_shmName": self._shm.name,
+                "_ownerPid": self._ownerPid,
+                "_written": self._written}
+
+    def __setstate__(self, state):
+        self._shm = shared_memory.SharedMemory(name=state.pop("_shmName"))
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8", "replace")[-self._size:]
+
+        with self._lock:
+            written = self._written.value
+            position = written % self._size
+            first = min(len(data), self._size - position)
+
+            self._shm.buf[position:position + first] = data[:first]
+            self._shm.buf[:len(data) - first] = data[first:]
+            self._written.value = written + len(data)
+
+        return len(text)
+
+    def getvalue(self) -> str:
+        written = self._written.value
+        if written <= self._size:
+            data = self._shm.buf[:written].tobytes()
+        else:
+            position = written % self._size
+            data = self._shm.buf[position:].tobytes() + self._shm.buf[:position].tobytes()
+
+        return data.decode("utf-8", "replace")
+
+    def close(self):
+        super().close()
+        self._shm.close()
+        if os.getpid() == self._ownerPid:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _worker_log_path() -> str:
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'worker_error.log'))
+
+
+def _write_worker_log(log_buffer: RingLog):
+    with open(_worker_log_path(), 'w', encoding='utf-8') as log_file:
+        log_file.write(log_buffer.getvalue())
+
+
+def run_server_process(recv_queue: ShmChannel, send_queue: ShmChannel, log_buffer: RingLog):
     # Clear previous log file
+    log_path = _worker_log_path()
     if os.path.exists(log_path):
         try:
             os.remove(log_path)
         except OSError:
             pass  # Ignore if we can't remove it, we'll overwrite it anyway
-        
-    log_file = open(log_path, 'w', encoding='utf-8')
-    # Redirect stdout and stderr
-    sys.stdout = log_file
-    sys.stderr = log_file
 
+    # Redirect stdout and stderr to shared memory, the log file is only written if the worker stops.
+    # A worker killed without reaching the finally below is written out by the controller
+    sys.stdout = log_buffer
+    sys.stderr = log_buffer
+
+    stopped = False
     try:
         from ..worker.dispatch import Dispatch
         from ..worker.basedispatch import SetDispatchQueue
@@ -29,37 +112,76 @@ def run_server_process(recv_queue: multiprocessing.Queue, send_queue: multiproce
         SetDispatchQueue(recv_queue, send_queue)
         server_thread.start()
         server_thread.join()
+        stopped = server_thread.stopped
     except Exception:
         import traceback
         traceback.print_exc()
     finally:
-        # Ensure the log file is closed so the main process can access it
-        log_file.close()
+        # Dispatch only returns on the shutdown command while the worker is healthy, anything else is a failure
+        if not stopped:
+            _write_worker_log(log_buffer)
 
 
 class BaseController:
     _server_process = None
     _send_queue = None
     _recv_queue = None
+    _log_buffer = None
 
     def __init__(self):
         if self.__class__._server_process is None:
-            self.__class__._send_queue = multiprocessing.Queue()
-            self.__class__._recv_queue = multiprocessing.Queue()
+            self.__class__._send_queue = ShmChannel()
+            self.__class__._recv_queue = ShmChannel()
+            self.__class__._log_buffer = RingLog()
+            atexit.register(self.__class__.close_channels)
+            # Registered later, so runs first: the worker is stopped before its channels are closed
+            atexit.register(self.__class__.stop_server)
 
             self.run_server()
 
+    @classmethod
+    def stop_server(cls, timeout: float = 5):
+        """Ask the worker to flush pending saves and exit, terminate it if it does not in ``timeout``"""
+        process = cls._server_process
+        if process is None or not process.is_alive():
+            return
+
+        try:
+            cls._send_queue.put(PackEnv(Environment.Shutdown, ()), timeout=timeout)
+        except queue.Full:
+            pass
+        else:
+            process.join(timeout)
+
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout)
+            cls.save_worker_log()
+
+    @classmethod
+    def save_worker_log(cls):
+        """Write worker output to worker_error.log if the worker died, its own finally may not have run"""
+        process = cls._server_process
+        if process is not None and process.exitcode not in (None, 0):
+            _write_worker_log(cls._log_buffer)
+
+    @classmethod
+    def close_channels(cls):
+        for channel in (cls._send_queue, cls._recv_queue, cls._log_buffer):
+            if channel is not None:
+                channel.close()
+
     def run_server(self):
         multiprocessing.freeze_support()
         self.__class__._server_process = multiprocessing.Process(target=run_server_process,
-                                                       args=(self._send_queue, self._recv_queue),
+                                                       args=(self._send_queue, self._recv_queue, self._log_buffer),
                                                        daemon=True)
         self.__class__._server_process.start()
 
         # Wait for the launch of the process
-        if self.receive_wait() != 0x1:
+        if self.wait_launch() != 0x1:
             # The worker crashed. Let's read the log file.
-            log_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'worker_error.log'))
+            log_path = _worker_log_path()
             if os.path.exists(log_path):
                 with open(log_path, 'r', encoding='utf-8') as f:
                     error_log = f.read()
@@ -67,22 +189,39 @@ class BaseController:
                     print(f"--- Worker Process Error Log ---\\{error_log}\n--------------------------------", file=sys.__stderr__)
             raise Exception("Error: Worker process failed to start. See log above.")
 
+    def wait_launch(self):
+        # Poll with timeout instead of blocking get, so a crashed worker is noticed
+        while not self._recv_queue.poll(0.1):
+            if not self._server_process.is_alive():
+                self.save_worker_log()
+                return None
+
+        return self.receive()
+
     @property
     def ready_to_receive(self) -> bool:
-        return not self._recv_queue.empty()
+        return self._recv_queue.poll(0)
 
     def receive(self):
         data = self._recv_queue.get(False)
-        return data
+        return UnpackEnv(data)
 
     def receive_wait(self):
-        return self._recv_queue.get()
+        return UnpackEnv(self._recv_queue.get())
 
     def send(self, data):
-        self._send_queue.put(data, False)
+        # Channel is bounded, wait for the worker to drain it but not for a worker that is gone
+        while True:
+            try:
+                self._send_queue.put(data, timeout=SEND_TIMEOUT)
+                return
+            except queue.Full:
+                if not self._server_process.is_alive():
+                    self.save_worker_log()
+                    raise Exception("Error: Worker process is not running. See worker_error.log.")
 
     def sendEnv(self, env: Environment, *args):
-        self.send([env, *args])
+        self.send(PackEnv(env, OutOfBand(args)))
 
     def getData(self):
         if self.ready_to_receive:
@@ -91,78 +230,26 @@ class BaseController:
             return None
 
 
-class Controller(BaseController):
-    def setModsPath(self, path):
-        self.sendEnv(Environment.SetModsPath, path)
-
-    def setModsSourcesPath(self, path):
-        self.sendEnv(Environment.SetModsSourcesPath, path)
-
-    def reloadMods(self):
-        self.sendEnv(Environment.ReloadMods)
-
-    def reloadModsSources(self):
-        self.sendEnv(Environment.ReloadModsSources)
-
-    def getModsData(self):
-        self.sendEnv(Environment.GetModsData)
-
-    def getModsSourcesData(self):
-        self.sendEnv(Environment.GetModsSourcesData)
-
-    def installBaseMod(self, text):
-        self.sendEnv(Environment.InstallBaseMod, text)
-
-    def getModConflict(self, hash):
-        self.sendEnv(Environment.GetModConflict, hash)
-
-    def installMod(self, hash):
-        self.sendEnv(Environment.InstallMod, hash)
+def _envMethod(env: Environment):
+    def method(self, *args):
+        self.sendEnv(env, *args)
 
-    def uninstallMod(self, hash):
-        self.sendEnv(Environment.UninstallMod, hash)
+    method.__name__ = env.name[0].lower() + env.name[1:]
+    return method
 
-    def reinstallMod(self, hash):
-        self.sendEnv(Environment.ReinstallMod, hash)
 
-    def decompileMod(self, hash):
-        self.sendEnv(Environment.DecompileMod, hash)
+def _envMethods(cls):
+    # Environment.SetModName -> cls.setModName(*args)
+    for env in Environment:
+        # Shutdown is sent by stop_server, which also waits for the worker to exit
+        if env not in (Environment.Notification, Environment.Shutdown):
+            method = _envMethod(env)
+            method.__qualname__ = f"{cls.__name__}.{method.__name__}"
+            setattr(cls, method.__name__, method)
 
-    def deleteMod(self, hash):
-        self.sendEnv(Environment.DeleteMod, hash)
+    return cls
 
-    def forceInstallMod(self, hash):
-        self.sendEnv(Environment.ForceInstallMod, hash)
 
-    def createMod(self, folderName):
-        self.sendEnv(Environment.CreateMod, folderName)
-
-    def setModName(self, hash, name):
-        self.sendEnv(Environment.SetModName, hash, name)
-
-    def setModAuthor(self, hash, author):
-        self.sendEnv(Environment.SetModAuthor, hash, author)
-
-    def setModGameVersion(self, hash, gameVersion):
-        self.sendEnv(Environment.SetModGameVersion, hash, gameVersion)
-
-    def setModVersion(self, hash, version):
-        self.sendEnv(Environment.SetModVersion, hash, version)
-
-    def setModTags(self, hash, tags):
-        self.sendEnv(Environment.SetModTags, hash, tags)
-
-    def setModDescription(self, hash, description):
-        self.sendEnv(Environment.SetModDescription, hash, description)
-
-    def setModPreviews(self, hash, previews):
-        self.sendEnv(Environment.SetModPreviews, hash, previews)
-
-    def saveModSource(self, hash):
-        self.sendEnv(Environment.SaveModSource, hash)
-
-    def compileModSources(self, hash):
-        self.sendEnv(Environment.CompileModSources, hash)
-
-    def deleteModSources(self, hash):
-        self.sendEnv(Environment.DeleteModSources, hash)
+@_envMethods
+class Controller(BaseController):
+    """Command methods are generated from ``Environment``, e.g. ``setModName(hash, name)``"""
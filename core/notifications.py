@@ -1,7 +1,10 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
-class NotificationType(Enum):
+class NotificationType(IntEnum):
+    # Members hash and compare as plain ints; printing keeps the ``NotificationType.Name`` form
+    __str__ = Enum.__str__
+
     ## Mods Sources
     # Loading
     LoadingModSource = auto()
@@ -95,9 +98,19 @@ class NotificationType(Enum):
 
 
 class Notification:
+    __slots__ = ("notificationType", "args")
+
     def __init__(self, notificationType: NotificationType, *args):
         self.notificationType = notificationType
         self.args = args
 
     def __repr__(self):
         return f"<{self.notificationType}: {self.args}>"
+
+    def __reduce__(self):
+        # Pickled as a plain int and args tuple instead of an enum reference and a slots state dict
+        return _UnpackNotification, (int(self.notificationType), self.args)
+
+
+def _UnpackNotification(notificationType: int, args: tuple) -> Notification:
+    return Notification(NotificationType(notificationType), *args)
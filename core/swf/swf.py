@@ -620,6 +620,18 @@ class Swf:
 
         return None
 
+    def exportBinaryDataBatch(self, elIds) -> dict:
+        """Binary data of several elements in one pass over the tags: {elId: bytes}"""
+        needIds = set(elIds)
+        binaryData = {}
+        for element in self.elementsList:
+            if type(element) == DefineBinaryDataTag:
+                elId = GetElementId(element)
+                if elId in needIds and elId not in binaryData:
+                    binaryData[elId] = bytes(element.getData())[6:]
+
+        return binaryData
+
     def exportBinaryFile(self, binaryFilePath: str, element=None, elId=None):
         binaryData = self.exportBinaryData(element, elId)
 
@@ -3,22 +3,17 @@ Tools module for Brawlhalla Mod Loader
 Contains specialized tools for mod creation and manipulation
 """
 
-from .color_swapper import ColorSwapper, ColorConverter, process_swf_colors
-
 __all__ = [
     'ColorSwapper',
     'ColorConverter', 
+    'ColorIndex',
     'process_swf_colors'
 ]
 
 
-
-
-
-
-
-
-
-
-
-
+def __getattr__(name):
+    # Tools are loaded on first access, importing the package stays cheap
+    if name in __all__:
+        from . import color_swapper
+        return getattr(color_swapper, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,49 +5,108 @@ Enables batch color replacement within SWF sprites and shapes
 
 import os
 import re
-from typing import Dict, List, Tuple, Optional
-from ..swf.swf import Swf, GetElementId
-from ..ffdec.classes import (
-    DefineShapeTags, DefineBitsLossless2Tag, DefineSpriteTag,
-    FILLSTYLE, DefineBitsLosslessTags
-)
-from ..notifications import NotificationType
-from .basedispatch import SendNotification
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple, Optional, TYPE_CHECKING
+
+# SWF and FFDec classes are imported where they are used, so ColorConverter
+# and the tools package load without starting the JVM
+if TYPE_CHECKING:
+    from ..swf.swf import Swf
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# From this many mappings a vectorized sorted table beats dict lookups
+SORTED_TABLE_THRESHOLD = 256
+
+# Opt-in sharding of dict path recolors over threads. JPype converts each field
+# write on the Python side while holding the GIL, and concurrent writes into shared
+# FFDec shape records are not verified safe, so this is off until measured
+PARALLEL_SWAP = False
+SWAP_WORKERS = min(8, os.cpu_count() or 1)
+# Below this many shapes the pool costs more than it saves
+PARALLEL_SWAP_MIN_SHAPES = 256
+
+# Element kinds of the SWF walk
+_OTHER, _SHAPE, _SPRITE = range(3)
+
+_HEX_BYTES = [f"{byte:02X}" for byte in range(256)]
+
+
+def _fill_styles(shape):
+    """Fill styles list of a shape tag, empty if the shape has none"""
+    fill_styles = getattr(getattr(shape, 'shapes', None), 'fillStyles', None)
+    fill_styles = getattr(fill_styles, 'fillStyles', None)
+    return () if fill_styles is None else fill_styles
+
+
+class _SortedColorTable:
+    """Mappings as sorted key / value arrays, colors are looked up with a binary search"""
+
+    def __init__(self, table: Dict[int, int]):
+        self._keys = np.fromiter(table, dtype=np.int64, count=len(table))
+        order = np.argsort(self._keys)
+        self._keys = self._keys[order]
+        self._values = np.fromiter(table.values(), dtype=np.int64, count=len(table))[order]
+
+    def remap(self, colors):
+        """Remapped copy of a color array, unmapped colors are kept, and the mask of mapped colors"""
+        indexes = np.minimum(np.searchsorted(self._keys, colors), len(self._keys) - 1)
+        mapped = self._keys[indexes] == colors
+        return np.where(mapped, self._values[indexes], colors), mapped
+
+
+def _color_table(table: Dict[int, int]):
+    """Dict table for few mappings, sorted arrays for large palettes"""
+    if np is not None and len(table) >= SORTED_TABLE_THRESHOLD:
+        return _SortedColorTable(table)
+    return table
 
 
 class ColorSwapper:
     """Handles color swapping functionality for SWF files"""
+
+    # Element type -> _SHAPE/_SPRITE/_OTHER, resolved once per type instead of isinstance per element
+    _element_kinds: Dict[type, int] = {}
     
     def __init__(self, swf_path: str):
+        from ..swf.swf import Swf
+
         self.swf_path = swf_path
-        self.swf = Swf(swf_path)
+        self.swf: Swf = Swf(swf_path)
         self.color_replacements = {}
+        self._sprite_names = None
+        self._shape_elements = None
         
     def analyze_colors(self) -> Dict[int, int]:
         """
         Analyze all colors used in the SWF file
         Returns a dictionary of color values and their usage count
         """
-        color_usage = {}
-        
-        for element in self.swf.elementsList:
-            if isinstance(element, DefineShapeTags):
-                # Extract colors from shape fill styles
-                if hasattr(element, 'shapes') and hasattr(element.shapes, 'fillStyles'):
-                    if hasattr(element.shapes.fillStyles, 'fillStyles'):
-                        for fill_style in element.shapes.fillStyles.fillStyles:
-                            if hasattr(fill_style, 'color') and fill_style.color:
-                                color = int(fill_style.color)
-                                color_usage[color] = color_usage.get(color, 0) + 1
-                                
-            elif isinstance(element, DefineBitsLossless2Tag):
-                # Extract colors from bitmap data
-                if hasattr(element, 'bitmapData'):
-                    # This would require more complex bitmap analysis
-                    # For now, we'll focus on shape colors
-                    pass
-                    
-        return color_usage
+        shape_elements = self._get_shape_elements()
+        # Sound or script only SWFs have nothing to analyze
+        if not shape_elements:
+            return {}
+
+        # Bitmap colors would require more complex bitmap analysis,
+        # for now only shape colors are counted
+        colors = (getattr(fill_style, 'color', None)
+                  for element in shape_elements for fill_style in _fill_styles(element))
+        return Counter(int(color) for color in colors if color)
+
+    def _get_shape_elements(self) -> list:
+        """Top level shape tags of the SWF, filtered once per swapper"""
+        if self._shape_elements is None:
+            from ..ffdec.classes import DefineShapeTags
+
+            self._shape_elements = [element for element in self.swf.elementsList
+                                    if isinstance(element, DefineShapeTags)]
+        return self._shape_elements
     
     def swap_color(self, old_color: int, new_color: int, 
                    target_sprites: Optional[List[str]] = None) -> int:
@@ -62,46 +121,101 @@ class ColorSwapper:
         Returns:
             Number of replacements made
         """
-        replacements = 0
-        
-        for element in self.swf.elementsList:
-            if isinstance(element, DefineShapeTags):
+        return self.batch_color_swap({old_color: new_color}, target_sprites)[int(old_color)]
+
+    def _iter_shapes(self, elements, target_ids: Optional[Set[int]] = None):
+        """Yield shape tags of the elements, including shapes nested in sprites"""
+        from ..swf.swf import GetElementId
+
+        element_kinds = self._element_kinds
+        for element in elements:
+            element_type = type(element)
+            kind = element_kinds.get(element_type)
+            if kind is None:
+                kind = element_kinds[element_type] = self._get_element_kind(element_type)
+
+            if kind == _SHAPE:
                 # Check if this sprite should be processed
-                if target_sprites:
-                    sprite_name = self._get_sprite_name(element)
-                    if sprite_name not in target_sprites:
-                        continue
-                
-                # Process shape fill styles
-                if hasattr(element, 'shapes') and hasattr(element.shapes, 'fillStyles'):
-                    if hasattr(element.shapes.fillStyles, 'fillStyles'):
-                        for fill_style in element.shapes.fillStyles.fillStyles:
-                            if hasattr(fill_style, 'color') and fill_style.color:
-                                if int(fill_style.color) == old_color:
-                                    fill_style.color = new_color
-                                    element.setModified(True)
-                                    replacements += 1
-                                    
-            elif isinstance(element, DefineSpriteTag):
-                # Process nested sprites
-                if hasattr(element, 'tags'):
-                    for tag in element.tags:
-                        if isinstance(tag, DefineShapeTags):
-                            if hasattr(tag, 'shapes') and hasattr(tag.shapes, 'fillStyles'):
-                                if hasattr(tag.shapes.fillStyles, 'fillStyles'):
-                                    for fill_style in tag.shapes.fillStyles.fillStyles:
-                                        if hasattr(fill_style, 'color') and fill_style.color:
-                                            if int(fill_style.color) == old_color:
-                                                fill_style.color = new_color
-                                                tag.setModified(True)
-                                                replacements += 1
-                                                
-        return replacements
+                if target_ids is None or GetElementId(element) in target_ids:
+                    yield element
+
+            elif kind == _SPRITE:
+                # Nested shapes are not filtered by target sprites
+                yield from self._iter_shapes(getattr(element, 'tags', ()))
+
+    @staticmethod
+    def _get_element_kind(element_type) -> int:
+        from ..ffdec.classes import DefineShapeTags, DefineSpriteTag
+
+        if issubclass(element_type, DefineShapeTags):
+            return _SHAPE
+        if issubclass(element_type, DefineSpriteTag):
+            return _SPRITE
+        return _OTHER
+
+    @staticmethod
+    def _process_shape(shape, table, counts: Dict[int, int]):
+        """Remap the fill style colors of one shape through the color table"""
+        for fill_style in _fill_styles(shape):
+            color = getattr(fill_style, 'color', None)
+            if not color:
+                continue
+
+            if not isinstance(color, int):
+                color = int(color)
+
+            new_color = table.get(color)
+            if new_color is not None:
+                counts[color] += 1
+                # Identity mappings are counted as matches but not written
+                if new_color != color:
+                    fill_style.color = new_color
+                    shape.setModified(True)
+    
+    @classmethod
+    def _process_shapes(cls, shapes, table) -> Counter:
+        """Remap a shard of shapes, returns its own replacement counts"""
+        counts = Counter()
+        for shape in shapes:
+            cls._process_shape(shape, table, counts)
+        return counts
+
+    @staticmethod
+    def _remap_shapes(shapes, table: _SortedColorTable, counts: Dict[int, int]):
+        """
+        Remap the fill style colors of all shapes at once through a sorted table
+
+        Colors are gathered into one array, remapped with a single binary search,
+        and only the changed fill styles are written back.
+        """
+        fill_styles = []
+        colors = []
+
+        for shape in shapes:
+            for fill_style in _fill_styles(shape):
+                color = getattr(fill_style, 'color', None)
+                if color:
+                    fill_styles.append((fill_style, shape))
+                    colors.append(color if isinstance(color, int) else int(color))
+
+        colors_array = np.fromiter(colors, dtype=np.int64, count=len(colors))
+        remapped, mapped = table.remap(colors_array)
+
+        for index in np.flatnonzero(mapped).tolist():
+            counts[colors[index]] += 1
+
+        for index in np.flatnonzero(remapped != colors_array).tolist():
+            fill_style, shape = fill_styles[index]
+            fill_style.color = int(remapped[index])
+            shape.setModified(True)
     
     def batch_color_swap(self, color_mappings: Dict[int, int],
                         target_sprites: Optional[List[str]] = None) -> Dict[int, int]:
         """
-        Perform multiple color swaps in one operation
+        Perform multiple color swaps in one pass over the SWF
+
+        Every fill style is remapped once, so mappings do not chain
+        (``{a: b, b: a}`` swaps the two colors).
         
         Args:
             color_mappings: Dictionary of old_color -> new_color mappings
@@ -110,23 +224,52 @@ class ColorSwapper:
         Returns:
             Dictionary of old_color -> replacement_count
         """
-        results = {}
+        table = {int(old_color): int(new_color) for old_color, new_color in color_mappings.items()}
+        counts = {old_color: 0 for old_color in table}
+        # Identity mappings stay in the table, their matches are counted like before
+        table = _color_table(table)
+        
+        # Resolved once, so the hot loop only does a set lookup per shape
+        target_ids = self._get_target_ids(target_sprites) if target_sprites else None
         
-        for old_color, new_color in color_mappings.items():
-            count = self.swap_color(old_color, new_color, target_sprites)
-            results[old_color] = count
+        shapes = self._iter_shapes(self.swf.elementsList, target_ids)
+        if isinstance(table, _SortedColorTable):
+            self._remap_shapes(shapes, table, counts)
+        else:
+            shapes = list(shapes)
+            if PARALLEL_SWAP and SWAP_WORKERS > 1 and len(shapes) >= PARALLEL_SWAP_MIN_SHAPES:
+                shards = [shapes[n::SWAP_WORKERS] for n in range(SWAP_WORKERS)]
+                with ThreadPoolExecutor(max_workers=SWAP_WORKERS) as executor:
+                    for shard_counts in executor.map(lambda shard: self._process_shapes(shard, table), shards):
+                        for color, count in shard_counts.items():
+                            counts[color] += count
+            else:
+                for shape in shapes:
+                    self._process_shape(shape, table, counts)
             
-        return results
+        return counts
     
+    def _get_sprite_names(self) -> Dict[int, object]:
+        """Element id -> symbol class name map, read once per swapper"""
+        if self._sprite_names is None:
+            self._sprite_names = {} if self.swf.symbolClass is None else self.swf.symbolClass.getTags()
+        return self._sprite_names
+
+    def _get_target_ids(self, target_sprites: List[str]) -> Set[int]:
+        """Ids of the elements whose names are in target_sprites"""
+        target_set = frozenset(target_sprites)
+        # Names decoded from json data are not hashable and never match a sprite name
+        return {element_id for element_id, name in self._get_sprite_names().items()
+                if isinstance(name, str) and name in target_set}
+
     def _get_sprite_name(self, element) -> Optional[str]:
         """Get the sprite name for an element"""
-        try:
-            element_id = GetElementId(element)
-            if self.swf.symbolClass:
-                return self.swf.symbolClass.getTagName(element_id)
-        except:
-            pass
-        return None
+        from ..swf.swf import GetElementId
+
+        element_id = GetElementId(element)
+        if element_id is None:
+            return None
+        return self._get_sprite_names().get(element_id)
     
     def save_changes(self):
         """Save the modified SWF file"""
@@ -157,11 +300,18 @@ class ColorConverter:
     def hex_to_int(hex_color: str) -> int:
         """Convert hex color string to integer"""
         hex_color = hex_color.lstrip('#')
+        if len(hex_color) % 2 == 0 and hex_color.isalnum():
+            try:
+                return int.from_bytes(bytes.fromhex(hex_color), 'big')
+            except ValueError:
+                pass
         return int(hex_color, 16)
     
     @staticmethod
     def int_to_hex(color_int: int) -> str:
         """Convert integer color to hex string"""
+        if 0 <= color_int <= 0xFFFFFF:
+            return f"#{_HEX_BYTES[color_int >> 16]}{_HEX_BYTES[(color_int >> 8) & 0xFF]}{_HEX_BYTES[color_int & 0xFF]}"
         return f"#{color_int:06X}"
     
     @staticmethod
@@ -179,6 +329,14 @@ class ColorConverter:
             List of similar colors
         """
         target_r, target_g, target_b = ColorConverter.int_to_rgb(target_color)
+
+        if np is not None:
+            colors = np.asarray(color_list, dtype=np.int64)
+            mask = ((np.abs(((colors >> 16) & 0xFF) - target_r) <= tolerance) &
+                    (np.abs(((colors >> 8) & 0xFF) - target_g) <= tolerance) &
+                    (np.abs((colors & 0xFF) - target_b) <= tolerance))
+            return colors[mask].tolist()
+
         similar_colors = []
         
         for color in color_list:
@@ -191,6 +349,43 @@ class ColorConverter:
         return similar_colors
 
 
+class ColorIndex:
+    """
+    Color list presorted by red channel for repeated similar color queries
+
+    Each query binary-searches the red window and only checks
+    green/blue for the candidates inside it.
+    """
+
+    def __init__(self, colors: List[int]):
+        self.colors = [int(color) for color in colors]
+        order = sorted(range(len(self.colors)), key=lambda i: (self.colors[i] >> 16) & 0xFF)
+        self._order = order
+        self._red = [(self.colors[i] >> 16) & 0xFF for i in order]
+
+        if np is not None:
+            self._sorted_colors = np.asarray([self.colors[i] for i in order], dtype=np.int64)
+            self._sorted_order = np.asarray(order, dtype=np.int64)
+
+    def find_similar(self, target_color: int, tolerance: int = 30) -> List[int]:
+        """Colors within tolerance of the target, in original list order"""
+        target_r, target_g, target_b = ColorConverter.int_to_rgb(target_color)
+        start = bisect_left(self._red, target_r - tolerance)
+        end = bisect_right(self._red, target_r + tolerance)
+
+        if np is not None:
+            candidates = self._sorted_colors[start:end]
+            mask = ((np.abs(((candidates >> 8) & 0xFF) - target_g) <= tolerance) &
+                    (np.abs((candidates & 0xFF) - target_b) <= tolerance))
+            indexes = np.sort(self._sorted_order[start:end][mask])
+            return [self.colors[i] for i in indexes.tolist()]
+
+        indexes = sorted(i for i in self._order[start:end]
+                         if abs(((self.colors[i] >> 8) & 0xFF) - target_g) <= tolerance
+                         and abs((self.colors[i] & 0xFF) - target_b) <= tolerance)
+        return [self.colors[i] for i in indexes]
+
+
 def create_color_swapper_ui():
     """Create UI components for the Color Swapper tool"""
     # This would integrate with the existing UI framework
@@ -1,29 +1,84 @@
+import sys
+from operator import ne
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_LOW7 = 0x7F7F7F7F7F7F7F7F
+_HIGH = 0x8080808080808080
+
+_MARKER_TABLE = bytes.maketrans(b"\x00\x01", b" |")
+
+# Numba kernel, compiled on first compare; False if numba is not installed
+_countDiffKernel = None
+
+
+def _GetCountDiffKernel():
+    global _countDiffKernel
+
+    if _countDiffKernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _countDiffKernel = False
+        else:
+            @njit(boundscheck=False)
+            def _countDiff(a, b, n):
+                count = 0
+                for i in range(n):
+                    count += a[i] != b[i]
+                return count
+
+            _countDiffKernel = _countDiff
+
+    return _countDiffKernel
+
+
+def _CountDifferentBytes(b1: bytes, b2: bytes, length: int) -> int:
+    # Words are xor-ed and every non zero byte is folded into its high bit (SWAR),
+    # so 8 bytes are compared per lane
+    words = length // 8
+    tail = words * 8
+
+    if np is not None:
+        kernel = _GetCountDiffKernel()
+        if kernel:
+            return int(kernel(np.frombuffer(b1, dtype=np.uint8, count=length),
+                              np.frombuffer(b2, dtype=np.uint8, count=length), length))
+
+        x = np.frombuffer(b1, dtype=np.uint64, count=words) ^ np.frombuffer(b2, dtype=np.uint64, count=words)
+        marks = (((x & np.uint64(_LOW7)) + np.uint64(_LOW7)) | x) & np.uint64(_HIGH)
+        different = int(np.count_nonzero(marks.view(np.uint8)))
+
+        a = np.frombuffer(b1, dtype=np.uint8, count=length - tail, offset=tail)
+        b = np.frombuffer(b2, dtype=np.uint8, count=length - tail, offset=tail)
+        return different + int(np.count_nonzero(a != b))
+
+    # Without numpy the whole prefix is one big int lane
+    x = int.from_bytes(memoryview(b1)[:length], "big") ^ int.from_bytes(memoryview(b2)[:length], "big")
+    low7 = int.from_bytes(b"\x7f" * length, "big")
+    high = int.from_bytes(b"\x80" * length, "big")
+    return bin((((x & low7) + low7) | x) & high).count("1")
+
+
 def CompareBytes(b1: bytes, b2: bytes):
     min_len = min([len(b1), len(b2)])
     max_len = max([len(b1), len(b2)])
 
-    num_different_bytes = 0
-
-    for nchar in range(min_len):
-        if b1[nchar] != b2[nchar]:
-            num_different_bytes += 1
-
+    num_different_bytes = _CountDifferentBytes(b1, b2, min_len)
     num_different_bytes += max_len - min_len
 
     return 100 - round(100*num_different_bytes/max_len, 2)
 
 
 def PrintCompareBytes(b1: bytes, b2: bytes):
-    b1 = b1.hex()
-    b2 = b2.hex()
+    h1 = b1.hex().encode()
+    h2 = b2.hex().encode()
 
-    print(b1)
-    print(b2)
-
-    for nchar in range(min([len(b1), len(b2)])):
-        if b1[nchar] != b2[nchar]:
-            print("|", end="")
-        else:
-            print(" ", end="")
+    # Mismatch flags (0/1) translated to marker chars, written with one call
+    marker = bytes(map(ne, h1, h2)).translate(_MARKER_TABLE)
 
-    print()
+    sys.stdout.write(b"\n".join((h1, h2, marker, b"")).decode())
@@ -10,8 +10,16 @@ def RandomHash() -> str:
     return HashFromBytes(os.urandom(2**12))
 
 
-def HashFile(path: str) -> str:
+def HashFile(path: str, chunkSize: int = 2**20) -> str:
     with open(path, "rb") as file:
-        hash_ = HashFromBytes(file.read())
+        # Python 3.11+, hashes straight from the file buffer
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(file, "sha256").hexdigest()
 
-    return hash_
\ No newline at end of file
+        hash_ = hashlib.sha256()
+        buffer = bytearray(chunkSize)
+        view = memoryview(buffer)
+        while size := file.readinto(buffer):
+            hash_.update(view[:size])
+
+    return hash_.hexdigest()
@@ -1,10 +1,230 @@
 import os
 import sys
-import subprocess
 import time
-import ctypes
-import winreg as reg
+import logging
+import functools
+import logging.handlers
+from contextlib import contextmanager
 from pathlib import Path
+from types import SimpleNamespace
+
+# ctypes, winreg and subprocess are imported by the functions that use them,
+# so importing this module for get_app_path() stays cheap
+
+log = logging.getLogger("bmodloader.windows")
+log.setLevel(logging.INFO)
+log.propagate = False
+
+# Records are buffered and written out together when an entry point returns (or on errors)
+_log_buffer = logging.handlers.MemoryHandler(100, flushLevel=logging.ERROR,
+                                             target=logging.StreamHandler(sys.stdout))
+_log_buffer.target.setFormatter(logging.Formatter("%(message)s"))
+log.addHandler(_log_buffer)
+
+_SHCNE_ASSOCCHANGED = 0x08000000
+_SHCNF_IDLIST = 0x0000
+
+_ERROR_FILE_NOT_FOUND = 2
+_ERROR_ACCESS_DENIED = 5
+_INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+
+def _flush_log(func):
+    """Write the buffered log records out when func returns."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _log_buffer.flush()
+    return wrapper
+
+
+# Waits between attempts of a registry call denied while Explorer holds the key
+_REGISTRY_RETRY_DELAYS = (0.05, 0.2)
+
+
+def _retry(call, *args):
+    """
+    Run a Win32 registry call returning an error code, retrying with backoff on ERROR_ACCESS_DENIED.
+    Only an elevated process retries, without admin rights a denial is final.
+    """
+    if not _elevated():
+        return call(*args)
+
+    for delay in _REGISTRY_RETRY_DELAYS:
+        error = call(*args)
+        if error != _ERROR_ACCESS_DENIED:
+            return error
+        time.sleep(delay)
+    return call(*args)
+
+
+# Registry transaction the _set_value writes join, see _registry_transaction
+_transaction = None
+
+
+@functools.lru_cache(maxsize=None)
+def _win32():
+    """ctypes prototypes of the Win32 calls used here, bound on first use."""
+    import ctypes
+    from ctypes import wintypes
+
+    advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    ktmw32 = ctypes.WinDLL("ktmw32", use_last_error=True)
+    shell32 = ctypes.WinDLL("shell32")
+
+    def bind(dll, name, argtypes, restype):
+        function = getattr(dll, name)
+        function.argtypes = argtypes
+        function.restype = restype
+        return function
+
+    return SimpleNamespace(
+        # Creates the missing subkey and writes the value in one call
+        RegSetKeyValueW=bind(advapi32, "RegSetKeyValueW",
+                             (wintypes.HKEY, wintypes.LPCWSTR, wintypes.LPCWSTR,
+                              wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD), wintypes.LONG),
+        RegCreateKeyTransactedW=bind(advapi32, "RegCreateKeyTransactedW",
+                                     (wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.LPWSTR,
+                                      wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+                                      ctypes.POINTER(wintypes.HKEY), ctypes.POINTER(wintypes.DWORD),
+                                      wintypes.HANDLE, ctypes.c_void_p), wintypes.LONG),
+        RegSetValueExW=bind(advapi32, "RegSetValueExW",
+                            (wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD,
+                             wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD), wintypes.LONG),
+        RegDeleteTreeW=bind(advapi32, "RegDeleteTreeW", (wintypes.HKEY, wintypes.LPCWSTR), wintypes.LONG),
+        RegCloseKey=bind(advapi32, "RegCloseKey", (wintypes.HKEY,), wintypes.LONG),
+        CreateTransaction=bind(ktmw32, "CreateTransaction",
+                               (ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD, wintypes.DWORD,
+                                wintypes.DWORD, wintypes.DWORD, wintypes.LPWSTR), wintypes.HANDLE),
+        CommitTransaction=bind(ktmw32, "CommitTransaction", (wintypes.HANDLE,), wintypes.BOOL),
+        RollbackTransaction=bind(ktmw32, "RollbackTransaction", (wintypes.HANDLE,), wintypes.BOOL),
+        CloseHandle=bind(kernel32, "CloseHandle", (wintypes.HANDLE,), wintypes.BOOL),
+        CreateHardLinkW=bind(kernel32, "CreateHardLinkW",
+                             (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p), wintypes.BOOL),
+        GetFileAttributesW=bind(kernel32, "GetFileAttributesW", (wintypes.LPCWSTR,), wintypes.DWORD),
+        CopyFileW=bind(kernel32, "CopyFileW", (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL), wintypes.BOOL),
+        SHChangeNotify=bind(shell32, "SHChangeNotify",
+                            (wintypes.LONG, wintypes.UINT, ctypes.c_void_p, ctypes.c_void_p), None),
+        INVALID_HANDLE_VALUE=ctypes.c_void_p(-1).value,
+    )
+
+
+@contextmanager
+def _registry_transaction():
+    """
+    Group the _set_value writes of the block into one registry (KTM) transaction,
+    committed once at the end and rolled back if the block raises. The register_*
+    methods re-raise their errors while a transaction is open.
+    """
+    import ctypes
+
+    global _transaction
+
+    api = _win32()
+    handle = api.CreateTransaction(None, None, 0, 0, 0, 0, None)
+    if not handle or handle == api.INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    _transaction = handle
+    try:
+        yield
+    except BaseException:
+        api.RollbackTransaction(handle)
+        raise
+    else:
+        if not api.CommitTransaction(handle):
+            raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        _transaction = None
+        api.CloseHandle(handle)
+
+
+@functools.lru_cache(maxsize=4)
+def _registry_values(exe_path, icon_path):
+    """Open command and DefaultIcon values, encoded once and shared by every key that uses them."""
+    import ctypes
+
+    return (ctypes.create_unicode_buffer(f'"{exe_path}" "%1"'),
+            ctypes.create_unicode_buffer(f'"{icon_path}",0'))
+
+
+def _set_value(subkey, value, name=None, root=None):
+    """
+    Set a REG_SZ value (default value if name is None) of root\\subkey, creating the key if needed.
+    root defaults to HKEY_CLASSES_ROOT, value is a str or a prebuilt unicode buffer.
+    """
+    import ctypes
+    import winreg as reg
+    from ctypes import wintypes
+
+    api = _win32()
+    if root is None:
+        root = reg.HKEY_CLASSES_ROOT
+    data = value if isinstance(value, ctypes.Array) else ctypes.create_unicode_buffer(value)
+
+    if _transaction is None:
+        error = _retry(api.RegSetKeyValueW, root, subkey, name, reg.REG_SZ, data, ctypes.sizeof(data))
+    else:
+        key = wintypes.HKEY()
+        error = _retry(api.RegCreateKeyTransactedW, root, subkey, 0, None, 0, reg.KEY_WRITE, None,
+                       ctypes.byref(key), None, _transaction, None)
+        if not error:
+            try:
+                error = api.RegSetValueExW(key, name, 0, reg.REG_SZ, data, ctypes.sizeof(data))
+            finally:
+                api.RegCloseKey(key)
+
+    if error:
+        raise ctypes.WinError(error)
+
+# Handlers sharing the DefaultIcon / shell\open\command layout: (subkey, description, url protocol)
+_PROG_ID = "BrawlhallaModLoader.bmod"
+_URL_PROTOCOLS = (
+    ("bmod", "URL:Brawlhalla Mod", True),
+    ("gamebanana-brawlhalla", "GameBanana Brawlhalla Mod", False),
+)
+_STANDARD_TEMPLATE = ((_PROG_ID, "Brawlhalla Mod File", False),)
+_DIRECT_TEMPLATE = ((".bmod", None, False),)
+_ALTERNATIVE_TEMPLATE = (("BrawlhallaMod", "Brawlhalla Mod File", False),)
+_SHELL_TEMPLATE = _URL_PROTOCOLS + (
+    (r"Applications\Brawlhalla Mod Loader 2025 Beta.exe", "Brawlhalla Mod Loader 2025 Beta", False),
+)
+_UPDATE_TEMPLATE = _URL_PROTOCOLS + _STANDARD_TEMPLATE + _DIRECT_TEMPLATE
+
+
+def _apply(template, exe_path, icon_path):
+    """Write description, URL Protocol marker, DefaultIcon and open command of every template handler."""
+    command, icon = _registry_values(exe_path, icon_path)
+    for subkey, description, url_protocol in template:
+        if description is not None:
+            _set_value(subkey, description)
+        if url_protocol:
+            _set_value(subkey, "", name="URL Protocol")
+        _set_value(subkey + r"\DefaultIcon", icon)
+        _set_value(subkey + r"\shell\open\command", command)
+
+def _exists(path):
+    """Existence check. On Windows GetFileAttributesW skips the file open done by os.stat."""
+    if os.name == 'nt':
+        return _win32().GetFileAttributesW(os.fspath(path)) != _INVALID_FILE_ATTRIBUTES
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=8)
+def _resolve_icon(exe_dir, fallback):
+    """First existing icon of the installation, the executable itself if no .ico found."""
+    icon_paths = (
+        os.path.join(exe_dir, "file_icon.ico"),
+        os.path.join(exe_dir, "ui", "ui_sources", "resources", "icons", "App.ico"),
+        fallback
+    )
+    return next((path for path in icon_paths if _exists(path)), fallback)
 
 def is_admin():
     """Check if the script is running with administrator privileges."""
@@ -14,16 +234,27 @@ def is_admin():
         import ctypes
         return ctypes.windll.shell32.IsUserAnAdmin()
 
+@functools.lru_cache(maxsize=1)
+def _elevated():
+    """is_admin() of this process, it does not change while running."""
+    return bool(is_admin())
+
+@_flush_log
 def run_as_admin():
     """Run the script with administrator privileges."""
+    import ctypes
+    import subprocess
+
     if is_admin():
-        print("Already running as administrator.")
+        log.info("Already running as administrator.")
     else:
-        print("Requesting administrator privileges...")
-        # Filter out --register flag when re-running
-        filtered_args = [arg for arg in sys.argv if not arg.startswith('--')]
+        log.info("Requesting administrator privileges...")
+        # Filter out --register flag when re-running. A frozen exe is sys.executable itself,
+        # otherwise the interpreter needs the script path (argv[0]) as first parameter
+        args = sys.argv[1:] if getattr(sys, 'frozen', False) else sys.argv
+        params = subprocess.list2cmdline([arg for arg in args if not arg.startswith('--')])
         ctypes.windll.shell32.ShellExecuteW(
-            None, "runas", sys.executable, " ".join(filtered_args), None, 1
+            None, "runas", sys.executable, params, None, 1
         )
 
 def get_app_path():
@@ -33,6 +264,7 @@ def get_app_path():
     else:
         return os.path.dirname(os.path.abspath(__file__))
 
+@functools.lru_cache(maxsize=1)
 def get_current_exe_path():
     """Get the current executable path."""
     if getattr(sys, 'frozen', False):
@@ -42,12 +274,15 @@ def get_current_exe_path():
         return os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'run.py'))
 
 
+@_flush_log
 def register_as_latest():
     """
     Register the current instance as the latest mod loader version.
     This stores the executable path in HKEY_CURRENT_USER (no admin required).
     Always updates, even if another version was previously registered.
     """
+    import winreg as reg
+
     try:
         exe_path = get_current_exe_path()
         registry_key_path = r"Software\BrawlhallaModLoader"
@@ -57,29 +292,38 @@ def register_as_latest():
         with reg.CreateKey(reg.HKEY_CURRENT_USER, registry_key_path) as key:
             reg.SetValueEx(key, "LatestExecutable", 0, reg.REG_SZ, exe_path)
             reg.SetValueEx(key, "LastUpdated", 0, reg.REG_SZ, str(current_time))
+        get_latest_exe_path.cache_clear()
+        _registration_target.cache_clear()
+        find_latest_installation.cache_clear()
         
         return exe_path
     except Exception as e:
-        print(f"Error registering as latest: {e}")
+        log.error("Error registering as latest: %s", e)
         return None
 
+@functools.lru_cache(maxsize=1)
 def get_latest_exe_path():
     """
     Get the path to the latest registered mod loader executable.
     Returns the stored path, or current exe if not found.
+    Cached, register_as_latest resets the cache.
     """
+    import winreg as reg
+
     try:
         registry_key_path = r"Software\BrawlhallaModLoader"
         with reg.OpenKey(reg.HKEY_CURRENT_USER, registry_key_path) as key:
             latest_path, _ = reg.QueryValueEx(key, "LatestExecutable")
-            if os.path.exists(latest_path):
-                return latest_path
-    except (FileNotFoundError, OSError):
+        # A missing key, value or executable all fall through to the same fallback
+        if _exists(latest_path):
+            return latest_path
+    except OSError:
         pass
     
     # Fallback to current executable
     return get_current_exe_path()
 
+@_flush_log
 def update_protocol_handlers():
     """
     Update protocol handlers to point to the latest registered mod loader.
@@ -87,107 +331,46 @@ def update_protocol_handlers():
     AGGRESSIVELY clears old associations first.
     """
     try:
+        # Already validated, falls back to the current executable
         latest_exe = get_latest_exe_path()
-        if not latest_exe or not os.path.exists(latest_exe):
-            print("Warning: Latest executable path not found, using current executable")
-            latest_exe = get_current_exe_path()
-        
-        exe_dir = os.path.dirname(latest_exe)
         
         # Try to find icon
-        icon_paths = [
-            os.path.join(exe_dir, "file_icon.ico"),
-            os.path.join(exe_dir, "ui", "ui_sources", "resources", "icons", "App.ico"),
-            latest_exe  # Use exe for icon if no .ico found
-        ]
-        
-        icon_path = latest_exe
-        for path in icon_paths:
-            if os.path.exists(path):
-                icon_path = path
-                break
+        icon_path = _resolve_icon(os.path.dirname(latest_exe), latest_exe)
         
-        print(f"Updating protocol handlers to: {latest_exe}")
+        log.info("Updating protocol handlers to: %s", latest_exe)
         
         # Try to update HKEY_CLASSES_ROOT (requires admin, but we'll try)
         try:
             # FIRST: Clear old associations aggressively
-            print("Clearing old associations...")
+            log.info("Clearing old associations...")
             clear_existing_associations()
             
-            # Update bmod:// protocol
-            print("Updating bmod:// protocol...")
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, r"bmod") as key:
-                reg.SetValue(key, None, reg.REG_SZ, "URL:Brawlhalla Mod")
-                reg.SetValueEx(key, "URL Protocol", 0, reg.REG_SZ, "")
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, r"bmod\shell\open\command") as key:
-                command = f'"{latest_exe}" "%1"'
-                reg.SetValue(key, None, reg.REG_SZ, command)
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, r"bmod\DefaultIcon") as key:
-                reg.SetValue(key, None, reg.REG_SZ, f'"{icon_path}",0')
-            
-            # Update GameBanana protocol
-            print("Updating gamebanana-brawlhalla protocol...")
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, r"gamebanana-brawlhalla") as key:
-                reg.SetValue(key, None, reg.REG_SZ, "GameBanana Brawlhalla Mod")
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, r"gamebanana-brawlhalla\shell\open\command") as key:
-                command = f'"{latest_exe}" "%1"'
-                reg.SetValue(key, None, reg.REG_SZ, command)
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, r"gamebanana-brawlhalla\DefaultIcon") as key:
-                reg.SetValue(key, None, reg.REG_SZ, f'"{icon_path}",0')
-            
-            # Update .bmod file association - use standard program ID method
-            print("Updating .bmod file association...")
-            prog_id = "BrawlhallaModLoader.bmod"
-            
-            # Set .bmod extension to point to program ID
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, ".bmod") as key:
-                reg.SetValue(key, None, reg.REG_SZ, prog_id)
-            
-            # Create/update program ID
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, prog_id) as key:
-                reg.SetValue(key, None, reg.REG_SZ, "Brawlhalla Mod File")
-            
-            # Set icon for program ID
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, f"{prog_id}\\DefaultIcon") as icon_key:
-                reg.SetValue(icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
+            # Written in one registry transaction, a failure rolls back every handler
+            log.info("Updating bmod://, gamebanana-brawlhalla:// and .bmod handlers...")
+            with _registry_transaction():
+                # .bmod points to the program ID, handlers are also set directly on it for compatibility
+                _set_value(".bmod", _PROG_ID)
+                _apply(_UPDATE_TEMPLATE, latest_exe, icon_path)
             
-            # Set command for program ID
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, f"{prog_id}\\shell\\open\\command") as command_key:
-                command = f'"{latest_exe}" "%1"'
-                reg.SetValue(command_key, None, reg.REG_SZ, command)
-            
-            # Also set icon directly on .bmod extension (for compatibility)
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, ".bmod\\DefaultIcon") as icon_key:
-                reg.SetValue(icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
-            
-            # Also set command directly on .bmod extension (for compatibility)
-            with reg.CreateKey(reg.HKEY_CLASSES_ROOT, ".bmod\\shell\\open\\command") as command_key:
-                command = f'"{latest_exe}" "%1"'
-                reg.SetValue(command_key, None, reg.REG_SZ, command)
-            
-            print(f"✓ Protocol handlers updated successfully!")
-            print(f"  Executable: {latest_exe}")
-            print(f"  Icon: {icon_path}")
+            log.info("✓ Protocol handlers updated successfully!")
+            log.info("  Executable: %s", latest_exe)
+            log.info("  Icon: %s", icon_path)
             return True
         except PermissionError:
             # Admin required
-            print("⚠ Admin privileges required to update protocol handlers.")
-            print("  Please run the mod loader as Administrator to update file associations.")
+            log.warning("⚠ Admin privileges required to update protocol handlers.")
+            log.warning("  Please run the mod loader as Administrator to update file associations.")
             return False
         except Exception as e:
-            print(f"Error updating protocol handlers: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error updating protocol handlers: %s", e)
             return False
     except Exception as e:
-        print(f"Error updating protocol handlers: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error updating protocol handlers: %s", e)
         return False
 
+@functools.lru_cache(maxsize=1)
 def find_latest_installation():
-    """Find the latest Brawlhalla Mod Loader installation."""
+    """Find the latest Brawlhalla Mod Loader installation. Cached, register_as_latest resets the cache."""
     try:
         # Look in common installation directories
         search_paths = [
@@ -197,156 +380,172 @@ def find_latest_installation():
         ]
         
         for search_path in search_paths:
-            if search_path.exists():
-                exe_files = list(search_path.glob("Brawlhalla Mod Loader*.exe"))
-                if exe_files:
-                    # Return the most recent one
-                    return max(exe_files, key=lambda x: x.stat().st_mtime)
+            # DirEntry.stat() reuses the data of the directory listing on Windows
+            try:
+                with os.scandir(search_path) as entries:
+                    # Case-insensitive like the Windows glob it replaces
+                    exe_files = [entry for entry in entries
+                                 if entry.name.lower().startswith("brawlhalla mod loader")
+                                 and entry.name.lower().endswith(".exe")]
+            except OSError:
+                continue
+            
+            if exe_files:
+                # Return the most recent one
+                return Path(max(exe_files, key=lambda entry: entry.stat().st_mtime).path)
         
         return None
     except Exception:
         return None
 
-def register_associations():
+@functools.lru_cache(maxsize=1)
+def _registration_target():
+    """Executable and icon paths the associations should point to, resolved once for check and register."""
+    # Use the latest registered executable path
+    latest_exe = get_latest_exe_path()
+    if latest_exe and _exists(latest_exe):
+        exe_path = latest_exe
+        app_path = os.path.dirname(exe_path)
+    else:
+        # Fallback to finding installation
+        latest_installation = find_latest_installation()
+        if latest_installation:
+            app_path = latest_installation.parent
+            exe_path = str(latest_installation)
+        else:
+            app_path = get_app_path()
+            exe_name = "Brawlhalla Mod Loader 2025 Beta.exe"
+            exe_path = os.path.join(app_path, exe_name)
+    
+    # Multiple icon path fallbacks for robustness
+    icon_path = _resolve_icon(str(app_path), exe_path)
+    return exe_path, icon_path
+
+@_flush_log
+def register_associations(force=False):
     """
     Creates file and URL protocol associations in the Windows registry using robust methods.
+    Associations already pointing to the target are left alone unless force is set.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Checked before elevating, an up to date registration needs no admin prompt
+    if not force and check_associations():
+        log.info("File associations are already up to date.")
+        return
+
     if not is_admin():
-        print("Requesting administrator privileges to register file associations.")
+        log.info("Requesting administrator privileges to register file associations.")
         run_as_admin()
         return
 
     try:
-        # Use the latest registered executable path
-        latest_exe = get_latest_exe_path()
-        if latest_exe and os.path.exists(latest_exe):
-            exe_path = latest_exe
-            app_path = os.path.dirname(exe_path)
-        else:
-            # Fallback to finding installation
-            latest_installation = find_latest_installation()
-            if latest_installation:
-                app_path = latest_installation.parent
-                exe_path = str(latest_installation)
-            else:
-                app_path = get_app_path()
-                exe_name = "Brawlhalla Mod Loader 2025 Beta.exe"
-                exe_path = os.path.join(app_path, exe_name)
-        
-        # Multiple icon path fallbacks for robustness
-        icon_paths = [
-            os.path.join(app_path, "file_icon.ico"),
-            os.path.join(app_path, "ui", "ui_sources", "resources", "icons", "App.ico"),
-            exe_path  # Use executable as icon if no .ico found
-        ]
+        exe_path, icon_path = _registration_target()
         
-        icon_path = None
-        for path in icon_paths:
-            if os.path.exists(path):
-                icon_path = path
-                break
-        
-        if not icon_path:
-            icon_path = exe_path  # Fallback to executable
-        
-        print(f"Using executable: {exe_path}")
-        print(f"Using icon: {icon_path}")
+        log.info("Using executable: %s", exe_path)
+        log.info("Using icon: %s", icon_path)
         
         # ROBUST METHOD 1: Clear existing associations first
-        print("Clearing existing .bmod associations...")
+        log.info("Clearing existing .bmod associations...")
         clear_existing_associations()
         
         # ROBUST METHOD 2: Copy icon to multiple locations
-        print("Copying icon to multiple system locations...")
+        log.info("Copying icon to multiple system locations...")
         copy_icon_to_system_locations(icon_path)
         
         # ROBUST METHOD 3: Multiple registration methods
-        print("Registering file associations with multiple methods...")
-        
-        # Method 3a: Standard program ID registration
-        register_standard_associations(exe_path, icon_path)
-        
-        # Method 3b: Direct extension association
-        register_direct_extension_association(exe_path, icon_path)
+        log.info("Registering file associations with multiple methods...")
+        
+        # All registrations are committed to the registry at once.
+        # Methods write disjoint subtrees and run concurrently, except 3a and 3b
+        # which both set the .bmod default value and keep their order
+        registrations = [
+            # Method 3a: Standard program ID registration
+            # Method 3b: Direct extension association
+            (register_standard_associations, register_direct_extension_association),
+            # Method 3c: Alternative program ID
+            (register_alternative_program_id,),
+            # Method 3d: Shell integration
+            (register_shell_integration,),
+        ]
         
-        # Method 3c: Alternative program ID
-        register_alternative_program_id(exe_path, icon_path)
+        def register(methods):
+            for method in methods:
+                method(exe_path, icon_path)
         
-        # Method 3d: Shell integration
-        register_shell_integration(exe_path, icon_path)
+        with _registry_transaction():
+            with ThreadPoolExecutor(max_workers=len(registrations)) as executor:
+                list(executor.map(register, registrations))
         
         # ROBUST METHOD 4: Force icon cache refresh
-        print("Forcing icon cache refresh...")
+        log.info("Forcing icon cache refresh...")
         refresh_icon_cache()
         
-        print("ROBUST file and URL protocol associations created successfully!")
-        print("If icons don't appear immediately, try restarting Windows Explorer or your computer.")
+        log.info("ROBUST file and URL protocol associations created successfully!")
+        log.info("If icons don't appear immediately, try restarting Windows Explorer or your computer.")
 
     except Exception as e:
-        print(f"Error creating associations: {e}")
-        import traceback
-        print(f"Full error traceback: {traceback.format_exc()}")
+        log.exception("Error creating associations: %s", e)
 
 def check_associations():
-    """Check if the file associations are already registered."""
+    """Check if the file associations are registered and point to the current target."""
+    import winreg as reg
+
     try:
+        exe_path, icon_path = _registration_target()
+        command, icon = _registry_values(exe_path, icon_path)
+        
         prog_id = "BrawlhallaModLoader.bmod"
         with reg.OpenKey(reg.HKEY_CLASSES_ROOT, f"{prog_id}\\shell\\open\\command") as key:
-            return True
+            if reg.QueryValueEx(key, None)[0] != command.value:
+                return False
+        with reg.OpenKey(reg.HKEY_CLASSES_ROOT, f"{prog_id}\\DefaultIcon") as key:
+            return reg.QueryValueEx(key, None)[0] == icon.value
     except FileNotFoundError:
         return False
 
 def refresh_icon_cache():
-    """Refresh the Windows icon cache by restarting explorer.exe"""
+    """Refresh the Windows icon cache by notifying the shell that associations changed"""
     try:
-        # Kill explorer.exe
-        subprocess.run(["taskkill", "/f", "/im", "explorer.exe"], check=False, capture_output=True)
-        time.sleep(2)
-        # Restart explorer.exe
-        subprocess.Popen(["explorer.exe"])
-        print("Windows Explorer restarted to refresh icon cache.")
+        # Explorer reloads its icon and association caches, no restart needed
+        _win32().SHChangeNotify(_SHCNE_ASSOCCHANGED, _SHCNF_IDLIST, None, None)
+        log.info("Windows Explorer notified to refresh icon cache.")
     except Exception as e:
-        print(f"Error refreshing icon cache: {e}")
+        log.error("Error refreshing icon cache: %s", e)
 
 def clear_existing_associations():
     """Clear existing .bmod associations aggressively"""
+    import ctypes
+    import winreg as reg
+
     try:
-        # Clear .bmod extension
-        try:
-            reg.DeleteKey(reg.HKEY_CLASSES_ROOT, ".bmod")
-        except FileNotFoundError:
-            pass
-        
-        # Clear program IDs
-        program_ids = [
+        # .bmod extension, program IDs and Applications entry
+        keys = [
+            ".bmod",
             "BrawlhallaModLoader.bmod",
             "BrawlhallaModLoader",
             "bmod",
-            "BrawlhallaMod"
+            "BrawlhallaMod",
+            r"Applications\Brawlhalla Mod Loader 2025 Beta.exe"
         ]
         
-        for prog_id in program_ids:
-            try:
-                reg.DeleteKey(reg.HKEY_CLASSES_ROOT, prog_id)
-            except FileNotFoundError:
-                pass
-        
-        # Clear Applications entry
-        try:
-            reg.DeleteKey(reg.HKEY_CLASSES_ROOT, r"Applications\Brawlhalla Mod Loader 2025 Beta.exe")
-        except FileNotFoundError:
-            pass
+        # HKCR is opened once for all deletes. RegDeleteTreeW removes the key
+        # with all its subkeys (shell\open\command, DefaultIcon...)
+        with reg.OpenKey(reg.HKEY_CLASSES_ROOT, "", 0, reg.KEY_ALL_ACCESS) as hkcr:
+            for key in keys:
+                error = _retry(_win32().RegDeleteTreeW, int(hkcr), key)
+                if error and error != _ERROR_FILE_NOT_FOUND:
+                    raise ctypes.WinError(error)
         
-        print("Cleared existing .bmod associations")
+        log.info("Cleared existing .bmod associations")
     except Exception as e:
-        print(f"Error clearing associations: {e}")
+        log.error("Error clearing associations: %s", e)
 
 def copy_icon_to_system_locations(icon_path):
     """Copy icon to multiple system locations for better visibility"""
+    from concurrent.futures import ThreadPoolExecutor
+
     try:
-        import shutil
-        import os
-        
         # Get system directories
         appdata = os.environ.get('APPDATA', '')
         localappdata = os.environ.get('LOCALAPPDATA', '')
@@ -360,142 +559,106 @@ def copy_icon_to_system_locations(icon_path):
             os.path.join(os.path.dirname(icon_path), "file_icon.ico")
         ]
         
-        for location in locations:
+        for directory in set(map(os.path.dirname, locations)):
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError:
+                pass
+        
+        source = os.path.normcase(os.path.abspath(icon_path))
+        locations = [location for location in locations
+                     if os.path.normcase(os.path.abspath(location)) != source]
+        
+        def copy_one(location):
             try:
-                os.makedirs(os.path.dirname(location), exist_ok=True)
-                shutil.copy2(icon_path, location)
-                print(f"Copied icon to: {location}")
+                _link_or_copy_file(icon_path, location)
             except Exception as e:
-                print(f"Failed to copy icon to {location}: {e}")
+                return e
+        
+        # Independent files, possibly on different volumes: copied concurrently, logged in order
+        with ThreadPoolExecutor(max_workers=len(locations) or 1) as executor:
+            for location, error in zip(locations, executor.map(copy_one, locations)):
+                if error is None:
+                    log.info("Copied icon to: %s", location)
+                else:
+                    log.warning("Failed to copy icon to %s: %s", location, error)
                 
     except Exception as e:
-        print(f"Error copying icon to system locations: {e}")
+        log.error("Error copying icon to system locations: %s", e)
+
+def _link_or_copy_file(source, destination):
+    """Hardlink destination to source on the same volume, copy it in the kernel otherwise."""
+    import ctypes
+
+    try:
+        os.unlink(destination)
+    except FileNotFoundError:
+        pass
+    
+    api = _win32()
+    if api.CreateHardLinkW(destination, source, None):
+        return
+    
+    # Other volume (ERROR_NOT_SAME_DEVICE) or no hardlink support, copy instead
+    if not api.CopyFileW(source, destination, False):
+        raise ctypes.WinError(ctypes.get_last_error())
 
 def register_standard_associations(exe_path, icon_path):
     """Register standard program ID associations"""
     try:
-        prog_id = "BrawlhallaModLoader.bmod"
-        
         # HKEY_CLASSES_ROOT\.bmod -> BrawlhallaModLoader.bmod
-        with reg.CreateKey(reg.HKEY_CLASSES_ROOT, ".bmod") as key:
-            reg.SetValue(key, None, reg.REG_SZ, prog_id)
-
-        # HKEY_CLASSES_ROOT\BrawlhallaModLoader.bmod
-        with reg.CreateKey(reg.HKEY_CLASSES_ROOT, prog_id) as key:
-            reg.SetValue(key, None, reg.REG_SZ, "Brawlhalla Mod File")
-            
-            # Set the icon
-            with reg.CreateKey(key, "DefaultIcon") as icon_key:
-                reg.SetValue(icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
-            
-            # Set the open command
-            with reg.CreateKey(key, r"shell\open\command") as command_key:
-                command = f'"{exe_path}" "%1"'
-                reg.SetValue(command_key, None, reg.REG_SZ, command)
-            
-            # Add "Open with Brawlhalla Mod Loader" context menu
-            with reg.CreateKey(key, r"shell\openwith") as openwith_key:
-                reg.SetValue(openwith_key, None, reg.REG_SZ, "Open with Brawlhalla Mod Loader")
-                # Set icon for the context menu item
-                with reg.CreateKey(openwith_key, "DefaultIcon") as openwith_icon_key:
-                    reg.SetValue(openwith_icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
-                with reg.CreateKey(openwith_key, "command") as openwith_command_key:
-                    command = f'"{exe_path}" "%1"'
-                    reg.SetValue(openwith_command_key, None, reg.REG_SZ, command)
+        _set_value(".bmod", _PROG_ID)
+        _apply(_STANDARD_TEMPLATE, exe_path, icon_path)
+        
+        # Add "Open with Brawlhalla Mod Loader" context menu
+        command, icon = _registry_values(exe_path, icon_path)
+        _set_value(f"{_PROG_ID}\\shell\\openwith", "Open with Brawlhalla Mod Loader")
+        # Set icon for the context menu item
+        _set_value(f"{_PROG_ID}\\shell\\openwith\\DefaultIcon", icon)
+        _set_value(f"{_PROG_ID}\\shell\\openwith\\command", command)
         
-        print("Standard associations registered")
+        log.info("Standard associations registered")
     except Exception as e:
-        print(f"Error registering standard associations: {e}")
+        log.error("Error registering standard associations: %s", e)
+        if _transaction is not None:
+            raise
 
 def register_direct_extension_association(exe_path, icon_path):
     """Register direct extension association (alternative method)"""
     try:
         # Direct extension association
-        with reg.CreateKey(reg.HKEY_CLASSES_ROOT, ".bmod") as key:
-            reg.SetValue(key, None, reg.REG_SZ, "BrawlhallaModLoader")
-            reg.SetValue(key, "Content Type", reg.REG_SZ, "application/x-brawlhalla-mod")
-            reg.SetValue(key, "PerceivedType", reg.REG_SZ, "document")
-            
-            # Direct icon setting
-            with reg.CreateKey(key, "DefaultIcon") as icon_key:
-                reg.SetValue(icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
-            
-            # Direct command setting
-            with reg.CreateKey(key, r"shell\open\command") as command_key:
-                command = f'"{exe_path}" "%1"'
-                reg.SetValue(command_key, None, reg.REG_SZ, command)
+        _set_value(".bmod", "BrawlhallaModLoader")
+        _set_value(r".bmod\Content Type", "application/x-brawlhalla-mod")
+        _set_value(r".bmod\PerceivedType", "document")
+        _apply(_DIRECT_TEMPLATE, exe_path, icon_path)
         
-        print("Direct extension association registered")
+        log.info("Direct extension association registered")
     except Exception as e:
-        print(f"Error registering direct extension association: {e}")
+        log.error("Error registering direct extension association: %s", e)
+        if _transaction is not None:
+            raise
 
 def register_alternative_program_id(exe_path, icon_path):
     """Register alternative program ID for better compatibility"""
     try:
-        alt_prog_id = "BrawlhallaMod"
-        
-        with reg.CreateKey(reg.HKEY_CLASSES_ROOT, alt_prog_id) as key:
-            reg.SetValue(key, None, reg.REG_SZ, "Brawlhalla Mod File")
-            
-            # Set the icon
-            with reg.CreateKey(key, "DefaultIcon") as icon_key:
-                reg.SetValue(icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
-            
-            # Set the open command
-            with reg.CreateKey(key, r"shell\open\command") as command_key:
-                command = f'"{exe_path}" "%1"'
-                reg.SetValue(command_key, None, reg.REG_SZ, command)
-        
-        print("Alternative program ID registered")
+        _apply(_ALTERNATIVE_TEMPLATE, exe_path, icon_path)
+        log.info("Alternative program ID registered")
     except Exception as e:
-        print(f"Error registering alternative program ID: {e}")
+        log.error("Error registering alternative program ID: %s", e)
+        if _transaction is not None:
+            raise
 
 def register_shell_integration(exe_path, icon_path):
     """Register shell integration for Windows Explorer"""
     try:
-        # bmod:// URL protocol association
-        url_prog_id = "bmod"
-        with reg.CreateKey(reg.HKEY_CLASSES_ROOT, url_prog_id) as key:
-            reg.SetValue(key, None, reg.REG_SZ, "URL:Brawlhalla Mod")
-            reg.SetValueEx(key, "URL Protocol", 0, reg.REG_SZ, "")
-            
-            # Set the icon
-            with reg.CreateKey(key, "DefaultIcon") as icon_key:
-                reg.SetValue(icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
-
-            # Set the open command
-            with reg.CreateKey(key, r"shell\open\command") as command_key:
-                command = f'"{exe_path}" "%1"'
-                reg.SetValue(command_key, None, reg.REG_SZ, command)
-
-        # Register GameBanana URL handling
-        gamebanana_prog_id = "gamebanana-brawlhalla"
-        with reg.CreateKey(reg.HKEY_CLASSES_ROOT, gamebanana_prog_id) as key:
-            reg.SetValue(key, None, reg.REG_SZ, "GameBanana Brawlhalla Mod")
-            
-            # Set the icon
-            with reg.CreateKey(key, "DefaultIcon") as icon_key:
-                reg.SetValue(icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
-
-            # Set the open command
-            with reg.CreateKey(key, r"shell\open\command") as command_key:
-                command = f'"{exe_path}" "%1"'
-                reg.SetValue(command_key, None, reg.REG_SZ, command)
-
-        # Add to "Open With" list with proper icon
-        with reg.CreateKey(reg.HKEY_CLASSES_ROOT, r"Applications\Brawlhalla Mod Loader 2025 Beta.exe") as app_key:
-            reg.SetValue(app_key, None, reg.REG_SZ, "Brawlhalla Mod Loader 2025 Beta")
-            # Set icon for the application in Open With list
-            with reg.CreateKey(app_key, "DefaultIcon") as app_icon_key:
-                reg.SetValue(app_icon_key, None, reg.REG_SZ, f'"{icon_path}",0')
-            with reg.CreateKey(app_key, r"shell\open\command") as app_command_key:
-                command = f'"{exe_path}" "%1"'
-                reg.SetValue(app_command_key, None, reg.REG_SZ, command)
-        
-        print("Shell integration registered")
+        # bmod:// and GameBanana URL protocols, plus the "Open With" list entry
+        _apply(_SHELL_TEMPLATE, exe_path, icon_path)
+        log.info("Shell integration registered")
     except Exception as e:
-        print(f"Error registering shell integration: {e}")
+        log.error("Error registering shell integration: %s", e)
+        if _transaction is not None:
+            raise
 
 if __name__ == '__main__':
     if '--register' in sys.argv:
-        register_associations()
+        register_associations(force='--force' in sys.argv)
@@ -1,20 +1,51 @@
 """
 Asynchronous mod loading implementation for better UI responsiveness
 """
+import atexit
 import asyncio
+import logging
+import functools
 import threading
 import time
 import os
+from itertools import islice, repeat
 from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor
-import queue
 
 from .mod import ModClass
 from .basedispatch import SendNotification
-from .notifications import NotificationType
+from ..notifications import NotificationType
 from .variables import MODS_PATH, MOD_FILE_FORMAT, CheckExists
 
 
+# Silent unless the application configures logging, messages are formatted only when a handler wants them
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Per-element install notifications and progress are sent at most this often (~30 per second)
+NOTIFY_INTERVAL = 1 / 30
+# Game SWFs are independent files, a chunk of them is opened, patched and saved concurrently
+SWF_WORKERS = min(4, os.cpu_count() or 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _swf_pool() -> ThreadPoolExecutor:
+    """Executor shared by all ChunkedModProcessor instances, concurrent installs don't multiply threads"""
+    pool = ThreadPoolExecutor(max_workers=SWF_WORKERS)
+    atexit.register(pool.shutdown, wait=True)
+    return pool
+
+
+# Game SWFs are process wide singletons (GAME_SWFS), installs sharing the pool must not edit one file at once
+_swf_locks: Dict[str, threading.Lock] = {}
+_swf_locks_guard = threading.Lock()
+
+
+def _swf_lock(swf_name: str) -> threading.Lock:
+    with _swf_locks_guard:
+        return _swf_locks.setdefault(swf_name, threading.Lock())
+
+
 class AsyncModLoader:
     """
     Asynchronous mod loader that processes mods in chunks to prevent UI blocking
@@ -24,82 +55,74 @@ class AsyncModLoader:
         self.mods_cache_path = mods_cache_path
         self.max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.progress_queue = queue.Queue()
+        self.progress_queue = asyncio.Queue()
         self.loading_mods = []
         self.completed_mods = []
         self.failed_mods = []
         
-    def load_mods_async(self, progress_callback=None):
+    async def load_mods_async(self, progress_callback=None):
         """
-        Load mods asynchronously with progress updates
+        Load mods asynchronously with progress updates.
+        Mods are built on the executor; every finished mod puts
+        ``(processed, total, mod_path)`` into ``progress_queue``
         """
-        def _load_mods():
-            try:
-                mods_hashes = []
-                mod_files = []
-                
-                # Get list of mod files
-                if MODS_PATH:
-                    mods_path = MODS_PATH[0]
-                    CheckExists(mods_path, True)
-                    
-                    for mod_file in os.listdir(mods_path):
-                        mod_path = os.path.join(mods_path, mod_file)
-                        if mod_file.endswith(f".{MOD_FILE_FORMAT}") and os.path.isfile(mod_path):
-                            mod_files.append(mod_path)
-                
-                total_files = len(mod_files)
-                processed_files = 0
+        try:
+            loop = asyncio.get_running_loop()
+            mods_hashes = set()
+            mod_files = []
+            
+            # Get list of mod files
+            if MODS_PATH:
+                mods_path = MODS_PATH[0]
+                CheckExists(mods_path, True)
                 
-                # Process mods in chunks
-                chunk_size = max(1, total_files // 10)  # Process in 10 chunks
+                # DirEntry.is_file() reuses the directory listing data, no stat per file
+                suffix = f".{MOD_FILE_FORMAT}"
+                with os.scandir(mods_path) as entries:
+                    mod_files = [entry.path for entry in entries
+                                 if entry.name.endswith(suffix) and entry.is_file()]
+            
+            total_files = len(mod_files)
+            processed_files = 0
+            
+            # Submit every mod up front so all workers stay busy, results are taken as they finish
+            tasks = []
+            for mod_path in mod_files:
+                SendNotification(NotificationType.LoadingMod, mod_path)
+                tasks.append(self._load_mod_task(loop, mod_path))
+            
+            for task in asyncio.as_completed(tasks):
+                mod_path, mod_class, error = await task
+                if error is not None:
+                    log.error("Error loading mod %s: %s", mod_path, error)
+                    self.failed_mods.append((mod_path, str(error)))
+                    continue
                 
-                for i in range(0, total_files, chunk_size):
-                    chunk = mod_files[i:i + chunk_size]
+                if mod_class and mod_class.hash not in mods_hashes:
+                    mods_hashes.add(mod_class.hash)
+                    self.completed_mods.append(mod_class)
                     
-                    # Process chunk
-                    for mod_path in chunk:
-                        try:
-                            SendNotification(NotificationType.LoadingMod, mod_path)
-                            
-                            # Create mod in background thread
-                            future = self.executor.submit(self._load_single_mod, mod_path)
-                            
-                            # Wait for completion with timeout
-                            try:
-                                mod_class = future.result(timeout=30)  # 30 second timeout per mod
-                                
-                                if mod_class and mod_class.hash not in mods_hashes:
-                                    mods_hashes.append(mod_class.hash)
-                                    self.completed_mods.append(mod_class)
-                                    
-                                processed_files += 1
-                                
-                                # Update progress
-                                if progress_callback:
-                                    progress_callback(processed_files, total_files, mod_path)
-                                    
-                            except Exception as e:
-                                print(f"Error loading mod {mod_path}: {e}")
-                                self.failed_mods.append((mod_path, str(e)))
-                                
-                        except Exception as e:
-                            print(f"Error processing mod file {mod_path}: {e}")
-                            self.failed_mods.append((mod_path, str(e)))
-                    
-                    # Small delay to prevent UI blocking
-                    time.sleep(0.1)
-                
-                return self.completed_mods
+                processed_files += 1
                 
-            except Exception as e:
-                print(f"Error in async mod loading: {e}")
-                return []
-        
-        # Run in background thread
-        thread = threading.Thread(target=_load_mods, daemon=True)
-        thread.start()
-        return thread
+                # Update progress
+                self.progress_queue.put_nowait((processed_files, total_files, mod_path))
+                if progress_callback:
+                    progress_callback(processed_files, total_files, mod_path)
+            
+            return self.completed_mods
+            
+        except Exception:
+            log.exception("Error in async mod loading")
+            return []
+    
+    async def _load_mod_task(self, loop, mod_path: str):
+        """
+        Load a single mod file on the executor, keeping its path with the result
+        """
+        try:
+            return mod_path, await loop.run_in_executor(self.executor, self._load_single_mod, mod_path), None
+        except Exception as e:
+            return mod_path, None, e
     
     def _load_single_mod(self, mod_path: str) -> Optional[ModClass]:
         """
@@ -108,8 +131,8 @@ class AsyncModLoader:
         try:
             mod_class = ModClass(modPath=mod_path, modsCachePath=self.mods_cache_path)
             return mod_class
-        except Exception as e:
-            print(f"Error loading mod {mod_path}: {e}")
+        except Exception:
+            log.exception("Error loading mod %s", mod_path)
             return None
     
     def get_progress(self) -> Dict[str, Any]:
@@ -140,6 +163,10 @@ class ChunkedModProcessor:
         self.progress = 0
         self.total_steps = 0
         self.current_step = 0
+        self._last_notify_ts = 0.0
+        self._last_progress_ts = 0.0
+        # Guards current_step and the notification timestamps, SWFs are processed on several threads
+        self._step_lock = threading.Lock()
         
     def install_chunked(self, chunk_size: int = 5):
         """
@@ -162,41 +189,46 @@ class ChunkedModProcessor:
             SendNotification(NotificationType.InstallingModFinished, self.mod_class.hash)
             return True
             
-        except Exception as e:
-            print(f"Error in chunked installation: {e}")
+        except Exception:
+            log.exception("Error in chunked installation")
             return False
     
     def _process_files_chunked(self, chunk_size: int):
         """
         Process mod files in chunks
         """
+        from .gamefiles import GameFiles
+
         files = list(self.mod_class.files.items())
-        
+
+        # A failed file is logged and the rest are still installed, as before the thread pool
+        with GameFiles.installSession(onError=self._file_failed) as session:
+            self._install_files(session, files, chunk_size)
+
+    @staticmethod
+    def _file_failed(file_name: str, error: Exception):
+        log.error("Error processing file %s", file_name, exc_info=error)
+
+    def _install_files(self, session, files, chunk_size: int):
         for i in range(0, len(files), chunk_size):
             chunk = files[i:i + chunk_size]
             
+            # One scan over the mod tags exports the whole chunk
+            payloads = self.mod_class.modSwf.exportBinaryDataBatch([el_id for el_id, _ in chunk])
+            
             for el_id, file_name in chunk:
                 try:
-                    SendNotification(NotificationType.InstallingModFile, self.mod_class.hash, file_name)
+                    self._send_sampled(NotificationType.InstallingModFile, self.mod_class.hash, file_name)
                     
-                    # Process file
-                    file_element = self.mod_class.modSwf.getElementById(el_id)
-                    if file_element:
-                        file_element = file_element[0]
-                        file_data = self.mod_class.modSwf.exportBinaryData(file_element)
-                        
-                        # Install file
-                        from .gamefiles import GameFiles
-                        GameFiles.installFile(file_name, file_data, self.mod_class.hash)
+                    # Install file
+                    file_data = payloads.get(el_id)
+                    if file_data is not None:
+                        session.installFile(file_name, file_data, self.mod_class.hash)
                     
-                    self.current_step += 1
-                    self._update_progress()
+                    self._advance()
                     
-                except Exception as e:
-                    print(f"Error processing file {file_name}: {e}")
-                
-            # Small delay to prevent UI blocking
-            time.sleep(0.05)
+                except Exception:
+                    log.exception("Error processing file %s", file_name)
     
     def _process_swfs_chunked(self, chunk_size: int):
         """
@@ -207,72 +239,93 @@ class ChunkedModProcessor:
         for i in range(0, len(swfs), chunk_size):
             chunk = swfs[i:i + chunk_size]
             
-            for swf_name, swf_map in chunk:
-                try:
-                    SendNotification(NotificationType.InstallingModSwf, self.mod_class.hash, swf_name)
-                    
-                    # Process SWF
-                    from .gamefiles import GetGameFileClass
-                    game_file = GetGameFileClass(swf_name)
-                    if game_file:
-                        game_file.open()
-                        self._process_swf_elements(game_file, swf_map, chunk_size)
-                        game_file.addInstalledMod(self.mod_class.hash)
-                        game_file.save()
-                        game_file.close()
-                    
-                    self.current_step += 1
-                    self._update_progress()
-                    
-                except Exception as e:
-                    print(f"Error processing SWF {swf_name}: {e}")
-                
-            # Small delay to prevent UI blocking
-            time.sleep(0.05)
+            list(_swf_pool().map(self._process_one_swf, chunk, repeat(chunk_size)))
+    
+    def _process_one_swf(self, swf, chunk_size: int):
+        """
+        Install elements of one game SWF
+        """
+        swf_name, swf_map = swf
+        try:
+            SendNotification(NotificationType.InstallingModSwf, self.mod_class.hash, swf_name)
+            
+            # Process SWF
+            from .gameswf import GetGameFileClass
+            game_file = GetGameFileClass(swf_name)
+            if game_file:
+                with _swf_lock(swf_name):
+                    game_file.open()
+                    self._process_swf_elements(game_file, swf_map, chunk_size)
+                    game_file.addInstalledMod(self.mod_class.hash)
+                    game_file.save()
+                    game_file.close()
+            
+            self._advance()
+            
+        except Exception:
+            log.exception("Error processing SWF %s", swf_name)
     
     def _process_swf_elements(self, game_file, swf_map, chunk_size: int):
         """
         Process SWF elements in chunks
         """
-        elements = []
-        for category, category_elements in swf_map.items():
-            for element in category_elements:
-                elements.append((category, element))
+        # Streamed, only one chunk of (category, element) pairs exists at a time
+        elements = ((category, element)
+                    for category, category_elements in swf_map.items()
+                    for element in category_elements)
         
-        for i in range(0, len(elements), chunk_size):
-            chunk = elements[i:i + chunk_size]
-            
+        while chunk := list(islice(elements, chunk_size)):
             for category, element in chunk:
                 try:
                     if category == "scripts":
                         script_anchor, content = element
-                        SendNotification(NotificationType.InstallingModSwfScript, self.mod_class.hash, script_anchor)
+                        self._send_sampled(NotificationType.InstallingModSwfScript, self.mod_class.hash, script_anchor)
                         game_file.importScript(content, script_anchor, self.mod_class.hash)
                         
                     elif category == "sounds":
                         sound_anchor = element
-                        SendNotification(NotificationType.InstallingModSwfSound, self.mod_class.hash, sound_anchor)
+                        self._send_sampled(NotificationType.InstallingModSwfSound, self.mod_class.hash, sound_anchor)
                         # Process sound...
                         
                     elif category == "sprites":
                         sprite = element
                         sprite_name = sprite if isinstance(sprite, str) else sprite["name"]
-                        SendNotification(NotificationType.InstallingModSwfSprite, self.mod_class.hash, sprite_name)
+                        self._send_sampled(NotificationType.InstallingModSwfSprite, self.mod_class.hash, sprite_name)
                         # Process sprite...
                     
-                    self.current_step += 1
-                    self._update_progress()
+                    self._advance()
                     
-                except Exception as e:
-                    print(f"Error processing element {element}: {e}")
-            
-            # Small delay to prevent UI blocking
-            time.sleep(0.02)
+                except Exception:
+                    log.exception("Error processing element %s", element)
+    
+    def _send_sampled(self, notificationType: NotificationType, *args):
+        """
+        Send notification unless one was sent less than NOTIFY_INTERVAL ago
+        """
+        now = time.monotonic()
+        with self._step_lock:
+            if now - self._last_notify_ts < NOTIFY_INTERVAL:
+                return
+            self._last_notify_ts = now
+        SendNotification(notificationType, *args)
+    
+    def _advance(self):
+        """
+        Count a finished step and update progress
+        """
+        with self._step_lock:
+            self.current_step += 1
+            self._update_progress()
     
     def _update_progress(self):
         """
-        Update progress and send notification
+        Update progress and send notification, sampled like element notifications, the last step always
         """
+        now = time.monotonic()
+        if now - self._last_progress_ts < NOTIFY_INTERVAL and self.current_step != self.total_steps:
+            return
+        self._last_progress_ts = now
+
         if self.total_steps > 0:
             progress_percent = int((self.current_step / self.total_steps) * 100)
             SendNotification(NotificationType.Debug, f"Progress: {progress_percent}% ({self.current_step}/{self.total_steps})")
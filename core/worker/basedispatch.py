@@ -1,12 +1,16 @@
 import threading
-import multiprocessing
+from typing import List, Tuple
 
-from ..commands import Environment
+from ..commands import Environment, PackEnv, UnpackEnv
+from ..controller.channel import ShmChannel, OutOfBand
 from ..notifications import Notification, NotificationType
 
 
 _dispatchMap = {}
 
+# Notifications are the hottest send path, their wire env value is resolved once
+_NOTIFICATION_ENV = Environment.Notification.value
+
 
 def Index(env):
     def caller(method):
@@ -22,7 +26,7 @@ def Index(env):
     return caller
 
 
-def SetDispatchQueue(recv_queue: multiprocessing.Queue, send_queue: multiprocessing.Queue):
+def SetDispatchQueue(recv_queue: ShmChannel, send_queue: ShmChannel):
     if BaseDispatch._recv_queue is None:
         BaseDispatch._recv_queue = recv_queue
     if BaseDispatch._send_queue is None:
@@ -34,6 +38,8 @@ class BaseDispatch(threading.Thread):
     _send_queue = None
 
     runThread = None
+    # Set by the shutdown command, ends the listener loop
+    stopped = False
 
     def __init__(self):
         if self.runThread is None:
@@ -48,22 +54,25 @@ class BaseDispatch(threading.Thread):
 
     @property
     def ready_to_receive(self) -> bool:
-        return not self._recv_queue.empty()
+        return self._recv_queue.poll(0)
 
     def receive(self):
-        return self._recv_queue.get(False)
+        return UnpackEnv(self._recv_queue.get(False))
 
     def receive_wait(self):
-        return self._recv_queue.get()
+        return UnpackEnv(self._recv_queue.get())
 
     def send(self, data):
-        self._send_queue.put(data, False)
+        self._send_queue.put(data)
+
+    def sendMany(self, data):
+        self._send_queue.put_many(data)
 
     def sendEnv(self, env: Environment, *args):
-        self.send([env, *args])
+        self.send(PackEnv(env, OutOfBand(args)))
 
     def listener(self):
-        while True:
+        while not self.stopped:
             self._dispatch(self.receive_wait())
 
     def _dispatch(self, data):
@@ -75,8 +84,12 @@ class BaseDispatch(threading.Thread):
             elif method := _dispatchMap.get(data[0], None):
                 method(self, *data[1:])
 
+    # Same frames as sendEnv(Environment.Notification, ...), built without PackEnv and OutOfBand
     def sendNotification(self, notification: Notification):
-        self.sendEnv(Environment.Notification, notification)
+        self.send((_NOTIFICATION_ENV, notification))
+
+    def sendNotifications(self, notifications: List[Notification]):
+        self.sendMany([(_NOTIFICATION_ENV, notification) for notification in notifications])
 
 
 def SendNotification(notificationType: NotificationType, *args):
@@ -85,3 +98,13 @@ def SendNotification(notificationType: NotificationType, *args):
         dispath.sendNotification(Notification(notificationType, *args))
     else:
         print(notificationType, "-", *args)
+
+
+def SendNotifications(notifications: List[Tuple]):
+    """Send batch of ``(notificationType, *args)`` notifications in one channel write"""
+    dispath = BaseDispatch.runThread
+    if dispath is not None:
+        dispath.sendNotifications([Notification(*notification) for notification in notifications])
+    else:
+        for notificationType, *args in notifications:
+            print(notificationType, "-", *args)
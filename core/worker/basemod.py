@@ -1,5 +1,5 @@
-import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 from ..swf.swf import Swf, GetElementId
 from ..worker.variables import CORE_VERSION
@@ -55,10 +55,18 @@ def _addText(swf: Swf, content: str, xmax, ymax, align="right", fontSize=13, col
 
 
 def _updateTextContent(textElem: DefineEditTextTag, newContent: str):
-    newText = re.sub(r"(<font .+>).+(<\/font>)",
-                     r"\1{}\2".format(newContent),
-                     str(textElem.initialText))
-    if newText != textElem.initialText:
+    # Content of the first <font> element is spliced between its tags
+    text = str(textElem.initialText)
+    fontStart = text.find("<font ")
+    if fontStart < 0:
+        return
+    contentStart = text.find(">", fontStart) + 1
+    contentEnd = text.find("</font>", contentStart)
+    if contentStart == 0 or contentEnd < 0:
+        return
+
+    newText = text[:contentStart] + newContent + text[contentEnd:]
+    if newText != text:
         textElem.initialText = newText
         textElem.setModified(True)
 
@@ -86,6 +94,22 @@ def _addPlaceObjectTag(swf: Swf, sprite, setCharacterId, depth, name, index,
     sprite.setModified(True)
 
 
+def _placeTagsByName(sprite) -> dict:
+    """PlaceObject2 tags of sprite by instance name, one pass over its tags (first tag wins)"""
+    placeByName = {}
+    for tag in sprite.getTags().iterator():
+        if isinstance(tag, PlaceObject2Tag):
+            placeByName.setdefault(str(tag.name), tag)
+
+    return placeByName
+
+
+def _findPanelInternalSprite(swf: Swf):
+    mainSprite = swf.getElementById(swf.symbolClass.getTagByName("a_ScreenSocialHub"))[0]
+    panelPlace = _placeTagsByName(mainSprite).get("am_PanelInternal")
+    return swf.getElementById(panelPlace.characterId if panelPlace is not None else 0)[0]
+
+
 def UninstallUIScreenSocialHubV1():
     gameSwf = GetGameFileClass("UI_ScreenSocialHub.swf")
     gameSwf.open()
@@ -93,16 +117,9 @@ def UninstallUIScreenSocialHubV1():
     swf = gameSwf.gameSwf
 
     if UI_SCREEN_SOCIAL_HUB_MOD_V1_ID in gameSwf.installed:
-        mainSprite = swf.getElementById(swf.symbolClass.getTagByName("a_ScreenSocialHub"))[0]
-        spriteId = 0
-        for tag in mainSprite.getTags().iterator():
-            if isinstance(tag, PlaceObject2Tag) and tag.name == "am_PanelInternal":
-                spriteId = tag.characterId
-                break
-
-        sprite = swf.getElementById(spriteId)[0]
+        sprite = _findPanelInternalSprite(swf)
 
-        for tag in list(sprite.getTags().iterator()).copy():
+        for tag in list(sprite.getTags().iterator()):
             if isinstance(tag, PlaceObject2Tag):
                 if tag.name == "v_bg":
                     pass
@@ -126,27 +143,16 @@ def InstallUIScreenSocialHubV1(bmlVersion):
 
     swf = gameSwf.gameSwf
 
+    # Sprite for editing, shared by the update and install branches
+    sprite = _findPanelInternalSprite(swf)
+
     # Update mod
     if UI_SCREEN_SOCIAL_HUB_MOD_V1_ID in gameSwf.installed:
-        mainSprite = swf.getElementById(swf.symbolClass.getTagByName("a_ScreenSocialHub"))[0]
-        spriteId = 0
-        for tag in mainSprite.getTags().iterator():
-            if isinstance(tag, PlaceObject2Tag) and tag.name == "am_PanelInternal":
-                spriteId = tag.characterId
-                break
-
-        sprite = swf.getElementById(spriteId)[0]
-
-        for tag in list(sprite.getTags().iterator()).copy():
-            if isinstance(tag, PlaceObject2Tag):
-                if tag.name == "v_bg":
-                    pass
-                elif tag.name == "v_bml":
-                    for elem in swf.getElementById(tag.characterId, DefineEditTextTag):
-                        _updateTextContent(elem, bmlVersion)
-                elif tag.name == "v_bh":
-                    for elem in swf.getElementById(tag.characterId, DefineEditTextTag):
-                        _updateTextContent(elem, BH_VERSION_TEXT)
+        placeByName = _placeTagsByName(sprite)
+        for name, content in (("v_bml", bmlVersion), ("v_bh", BH_VERSION_TEXT)):
+            if (tag := placeByName.get(name)) is not None:
+                for elem in swf.getElementById(tag.characterId, DefineEditTextTag):
+                    _updateTextContent(elem, content)
 
         sprite.setModified(True)
 
@@ -158,16 +164,7 @@ def InstallUIScreenSocialHubV1(bmlVersion):
         # Bh Version text
         bhTextId = _addText(swf, BH_VERSION_TEXT, 4200, 366)
 
-        # Find sprite for editing
-        mainSprite = swf.getElementById(swf.symbolClass.getTagByName("a_ScreenSocialHub"))[0]
-        spriteId = 0
-        for tag in mainSprite.getTags().iterator():
-            if isinstance(tag, PlaceObject2Tag) and tag.name == "am_PanelInternal":
-                spriteId = tag.characterId
-                break
-
-        sprite = swf.getElementById(spriteId)[0]
-        startIndex = len(list(sprite.getTags().iterator())) - 1
+        startIndex = sprite.getTags().size() - 1
 
         # Add background
         _addPlaceObjectTag(swf, sprite, swf.symbolClass.getTagByName("a_SocialHubCursor"), 9, "v_bg", startIndex,
@@ -187,6 +184,23 @@ def InstallUIScreenSocialHubV1(bmlVersion):
 from ..utils.hash import HashFile
 from .config import ModloaderCoreConfig
 
+def _overlay_loading_screen(loading_screen_path, overlay):
+    background = Image.open(loading_screen_path).convert("RGBA")
+
+    bg_width, bg_height = background.size
+    ov_width, ov_height = overlay.size
+    position = (bg_width - ov_width - 60, bg_height - ov_height - 10)
+
+    # Pasted onto the decoded background itself, no second full size canvas
+    background.paste(overlay, position, overlay)
+
+    if loading_screen_path.lower().endswith(('.jpg', '.jpeg')):
+        final_image = background.convert('RGB')
+        final_image.save(loading_screen_path, quality=100)
+    else:
+        background.save(loading_screen_path, format="PNG", compress_level=1, optimize=False)
+
+
 def apply_loading_screen_overlay():
     try:
         brawlhalla_path = BRAWLHALLA_PATH
@@ -208,42 +222,56 @@ def apply_loading_screen_overlay():
                 loading_screen_files.append(filename)
 
         # Check for removed files and clean up config
-        for stored_file in list(ModloaderCoreConfig.loadingScreenChecksums.keys()):
+        checksums = ModloaderCoreConfig.loadingScreenChecksums
+        stats = ModloaderCoreConfig.loadingScreenStats
+        for stored_file in list(checksums.keys()):
             if stored_file not in loading_screen_files:
-                del ModloaderCoreConfig.loadingScreenChecksums[stored_file]
+                del checksums[stored_file]
+                stats.pop(stored_file, None)
                 ModloaderCoreConfig.save()
 
-        # Process each loading screen
-        for filename in loading_screen_files:
-            loading_screen_path = os.path.join(ui_images_path, filename)
-            current_hash = HashFile(loading_screen_path)
-            original_hash = ModloaderCoreConfig.loadingScreenChecksums.get(filename)
-
-            # If file is new or has been reverted by a game update
-            if original_hash is None or original_hash == current_hash:
-                
-                # If it's a new file, store its original hash
-                if original_hash is None:
-                    ModloaderCoreConfig.loadingScreenChecksums[filename] = current_hash
-                    ModloaderCoreConfig.save()
-
-                # Apply the overlay
-                background = Image.open(loading_screen_path).convert("RGBA")
-                overlay = Image.open(overlay_path).convert("RGBA")
+        def check(filename):
+            # Untouched since the last run (same mtime and size), skip hashing the image
+            path = os.path.join(ui_images_path, filename)
+            file_stat = os.stat(path)
+            if filename in checksums and stats.get(filename) == [file_stat.st_mtime_ns, file_stat.st_size]:
+                return None
+            return HashFile(path), file_stat
+
+        def patch(filename):
+            path = os.path.join(ui_images_path, filename)
+            _overlay_loading_screen(path, overlay)
+            return os.stat(path)
+
+        # Screens are independent files and PIL codecs release the GIL, config is updated on this thread only
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            checked = {filename: result
+                       for filename, result in zip(loading_screen_files, executor.map(check, loading_screen_files))
+                       if result is not None}
+
+            # Apply to new files and to files reverted by a game update
+            to_patch = []
+            for filename, (current_hash, file_stat) in checked.items():
+                original_hash = checksums.get(filename)
+                if original_hash is None or original_hash == current_hash:
+                    # Stat is recorded once patched, an interrupted run patches it again next time
+                    to_patch.append(filename)
+                    checksums.setdefault(filename, current_hash)
+                else:
+                    stats[filename] = [file_stat.st_mtime_ns, file_stat.st_size]
+
+            # Original hashes are saved before any image is overwritten
+            if checked:
+                ModloaderCoreConfig.save()
 
-                bg_width, bg_height = background.size
-                ov_width, ov_height = overlay.size
-                position = (bg_width - ov_width - 60, bg_height - ov_height - 10)
+            if to_patch:
+                overlay = Image.open(overlay_path).convert("RGBA")
+                overlay.load()
 
-                combined = Image.new("RGBA", background.size)
-                combined.paste(background, (0,0))
-                combined.paste(overlay, position, overlay)
+                for filename, file_stat in zip(to_patch, executor.map(patch, to_patch)):
+                    stats[filename] = [file_stat.st_mtime_ns, file_stat.st_size]
 
-                if loading_screen_path.lower().endswith(('.jpg', '.jpeg')):
-                    final_image = combined.convert('RGB')
-                    final_image.save(loading_screen_path, quality=100)
-                else:
-                    combined.save(loading_screen_path, compress_level=1)
+                ModloaderCoreConfig.save()
 
     except Exception:
         # Silently fail to not interrupt the user
@@ -33,13 +33,22 @@ class ModloaderCoreConfigClass(DataClass):
     DataVariable(formatType, 1, "installedMods")
     installedMods: List[ModloaderCoreMods]
 
-    DataVariable(formatType, 2, "loadingScreenChecksums")
-    loadingScreenChecksums: Dict[str, str]
+    DataVariable(formatType, 1, "loadingScreenChecksums")
+    loadingScreenChecksums: Dict[str, str]    # {fileName: originalHash}
+
+    DataVariable(formatType, 1, "loadingScreenStats")
+    loadingScreenStats: Dict[str, list]    # {fileName: [mtimeNs, size]} when last checked
 
     def __init__(self):
         self.path = os.path.join(MODLOADER_CACHE_PATH, MODLOADER_CACHE_CORE_FILE)
         self.loadJsonFile(self.path)
 
+        # Missing in config saved before they were persisted
+        if self.loadingScreenChecksums is None:
+            self.loadingScreenChecksums = {}
+        if self.loadingScreenStats is None:
+            self.loadingScreenStats = {}
+
     def save(self):
         self.saveJsonFile(self.path)
 
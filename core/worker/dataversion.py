@@ -1,15 +1,50 @@
 import os
 import json
+import tempfile
 from typing import Dict, List, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def _jsonToDict(json_: str) -> dict:
+
+def _jsonToDict(json_: Union[str, bytes]) -> dict:
     try:
+        if orjson is not None:
+            return orjson.loads(json_)
         return json.loads(json_)
     except json.decoder.JSONDecodeError:
         return {}
 
 
+def _dictToJson(data: dict, formatJson=False) -> bytes:
+    if formatJson:
+        return json.dumps(data, indent=4, sort_keys=True).encode("utf-8")
+    if orjson is not None:
+        # Non str keys are stringified like the json module does
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
+def WriteFileAtomic(path: str, content: bytes):
+    # Write next to the target and swap, so readers never see a half-written file.
+    # Unique temp name, concurrent writers of one path don't share it
+    fd, tmpPath = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                   dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+
+        os.replace(tmpPath, path)
+    except BaseException:
+        try:
+            os.remove(tmpPath)
+        except OSError:
+            pass
+        raise
+
+
 class DataVariable:
     _varNamesMap: Dict[str, Dict[int, List[str]]] = {}
 
@@ -74,13 +109,13 @@ class DataClass(metaclass=DataMetaclass):
     formatVersion: int = 0
     formatType: str = ""
 
-    def loadFromJson(self, json_: Union[str, dict], ignoredVars=None, allowedVars=None) -> bool:
+    def loadFromJson(self, json_: Union[str, bytes, dict], ignoredVars=None, allowedVars=None) -> bool:
         if ignoredVars is None:
             ignoredVars = []
         if allowedVars is None:
             allowedVars = []
 
-        if isinstance(json_, str):
+        if isinstance(json_, (str, bytes)):
             data: dict = _jsonToDict(json_)
         else:
             data: dict = json_
@@ -120,7 +155,7 @@ class DataClass(metaclass=DataMetaclass):
             allowedVars = []
 
         if os.path.exists(path):
-            with open(path, "r") as file:
+            with open(path, "rb") as file:
                 loaded = self.loadFromJson(file.read(), ignoredVars, allowedVars)
 
             return loaded
@@ -146,19 +181,16 @@ class DataClass(metaclass=DataMetaclass):
         return data
 
     def getJson(self, ignoredVars=None, formatJson=False):
+        return self.getJsonBytes(ignoredVars, formatJson).decode("utf-8")
+
+    def getJsonBytes(self, ignoredVars=None, formatJson=False) -> bytes:
         if ignoredVars is None:
             ignoredVars = []
 
-        data = self.getDict(ignoredVars)
-
-        if formatJson:
-            return json.dumps(data, indent=4, sort_keys=True)
-        else:
-            return json.dumps(data)
+        return _dictToJson(self.getDict(ignoredVars), formatJson)
 
     def saveJsonFile(self, path, ignoredVars=None, formatJson=False):
         if ignoredVars is None:
             ignoredVars = []
 
-        with open(path, "w") as file:
-            file.write(self.getJson(ignoredVars, formatJson))
+        WriteFileAtomic(path, self.getJsonBytes(ignoredVars, formatJson))
@@ -4,6 +4,7 @@ from .basedispatch import BaseDispatch, Index
 from .variables import *
 from .modloader import ModLoader
 from .basemod import InstallBaseMod
+from .gamefiles import GameFiles
 
 from ..commands import Environment
 
@@ -227,3 +228,10 @@ class Dispatch(BaseDispatch):
             return True, hash
 
         return False, None
+
+    @Index(Environment.Shutdown)
+    def shutdown(self):
+        # Worker is a daemon process, pending index snapshot has to reach the disk before it ends
+        GameFiles.waitSaved()
+        self.stopped = True
+        return True
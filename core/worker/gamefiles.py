@@ -1,19 +1,28 @@
 import os
-from typing import Dict, List
-
-from .dataversion import DataClass, DataVariable
+import shutil
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from .dataversion import DataClass, DataVariable, WriteFileAtomic
 from .variables import (DATA_FORMAT_MODLOADER_FILES,
                         DATA_FORMAT_MODLOADER_VERSION,
                         MODLOADER_CACHE_PATH,
                         MODLOADER_CACHE_FILES_FILE,
                         MODLOADER_CACHE_FILES_FOLDER)
 from .brawlhalla import BRAWLHALLA_FILES, BRAWLHALLA_SWFS
-from .basedispatch import SendNotification
+from .basedispatch import SendNotification, SendNotifications
 
 from ..utils.hash import HashFile, HashFromBytes
 from ..notifications import NotificationType
 
 
+# Hashing and file copies release the GIL, so installs overlap on I/O
+INSTALL_WORKERS = min(8, os.cpu_count() or 1)
+
+
 class GameFilesData(DataClass):
     DataVariable(DATA_FORMAT_MODLOADER_FILES, 0, "formatVersion")
     formatVersion: int = DATA_FORMAT_MODLOADER_VERSION
@@ -30,6 +39,9 @@ class GameFilesData(DataClass):
     DataVariable(DATA_FORMAT_MODLOADER_FILES, 0, "modifiedFilesMap")
     modifiedFilesMap: Dict[str, str]    # {fileName: modHash}
 
+    DataVariable(DATA_FORMAT_MODLOADER_FILES, 1, "filesStat")
+    filesStat: Dict[str, list]    # {filePath: [mtimeNs, size, fileHash]}
+
     def loadData(self):
         self.loadJsonFile(os.path.join(MODLOADER_CACHE_PATH, MODLOADER_CACHE_FILES_FILE))
 
@@ -37,98 +49,270 @@ class GameFilesData(DataClass):
         self.saveJsonFile(os.path.join(MODLOADER_CACHE_PATH, MODLOADER_CACHE_FILES_FILE))
 
 
+class InstallSession:
+    """
+    Runs installFile calls of one mod on a thread pool. Stops at the first failed file,
+    or with ``onError`` reports each failed file to it and keeps installing the rest
+    """
+
+    def __init__(self, gameFiles: "GameFilesClass", onError: Optional[Callable[[str, Exception], None]] = None):
+        self.gameFiles = gameFiles
+        self.onError = onError
+        self.executor = ThreadPoolExecutor(max_workers=INSTALL_WORKERS)
+        self.futures: List[Future] = []
+
+        # Files queued or being written, caller blocks while the window is full so contents are not all held at once
+        self._slots = threading.BoundedSemaphore(2 * INSTALL_WORKERS)
+        self._lock = threading.Lock()
+        self._failed: Future = None
+
+    def installFile(self, fileName: str, modFileContent: bytes, modHash: str):
+        self._slots.acquire()
+
+        with self._lock:
+            future = None
+            if self._failed is None:
+                future = self.executor.submit(self.gameFiles.installFile, fileName, modFileContent, modHash)
+                self.futures.append(future)
+
+        if future is None:
+            self._slots.release()
+            self._failed.result()
+
+        future.add_done_callback(partial(self._done, fileName))
+
+    def _done(self, fileName: str, future: Future):
+        self._slots.release()
+
+        if future.cancelled() or future.exception() is None:
+            return
+
+        if self.onError is not None:
+            self.onError(fileName, future.exception())
+            return
+
+        # First error cancels files not started yet
+        with self._lock:
+            if self._failed is None:
+                self._failed = future
+                for pending in self.futures:
+                    pending.cancel()
+
+    def wait(self):
+        self.executor.shutdown(wait=True)
+
+        if self._failed is not None:
+            self._failed.result()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
 class GameFilesClass(GameFilesData):
     def __init__(self):
         self.loadData()
         self.origPreviewsPath = os.path.join(MODLOADER_CACHE_PATH, MODLOADER_CACHE_FILES_FOLDER)
 
-        if not os.path.exists(self.origPreviewsPath):
-            os.mkdir(self.origPreviewsPath)
+        # Missing in files data saved before filesStat was added
+        if self.filesStat is None:
+            self.filesStat = {}
+        # Index changed by installFile and not saved yet, see flush()
+        self._dirty = False
 
-    def installFile(self, fileName: str, modFileContent: bytes, modHash: str):
-        SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Installing file: {fileName}")
-        SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: File size: {len(modFileContent)} bytes")
-        SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Mod hash: {modHash}")
-        
-        SendNotification(NotificationType.InstallingModFile, modHash, fileName)
+        # Guards index dicts, per file locks serialize parallel installs of the same path
+        self._indexLock = threading.Lock()
+        self._pathLocks: Dict[str, threading.Lock] = {}
+
+        # Latest-wins json snapshot written by the saver thread
+        self._saveLock = threading.Lock()
+        self._saveSnapshot = None
+        self._saveRequested = threading.Event()
+        self._saved = threading.Event()
+        self._saved.set()
+        threading.Thread(target=self._saver, daemon=True).start()
 
+        os.makedirs(self.origPreviewsPath, exist_ok=True)
+
+        # {cacheFileName: stat} of cached original files, one directory scan instead of a stat per install
+        with os.scandir(self.origPreviewsPath) as entries:
+            self._origCacheIndex: Dict[str, os.stat_result] = {entry.name: entry.stat()
+                                                               for entry in entries if entry.is_file()}
+
+    def saveData(self):
+        with self._indexLock, self._saveLock:
+            self._saveSnapshot = self.getJsonBytes()
+            self._saved.clear()
+            self._saveRequested.set()
+
+    def waitSaved(self, timeout: float = None) -> bool:
+        """Block until the last saveData snapshot is on disk"""
+        return self._saved.wait(timeout)
+
+    def _saver(self):
+        path = os.path.join(MODLOADER_CACHE_PATH, MODLOADER_CACHE_FILES_FILE)
+
+        while True:
+            self._saveRequested.wait()
+
+            with self._saveLock:
+                snapshot = self._saveSnapshot
+                self._saveSnapshot = None
+                self._saveRequested.clear()
+
+            try:
+                if snapshot is not None:
+                    WriteFileAtomic(path, snapshot)
+            except Exception as e:
+                # Any error is reported and the thread keeps running, waitSaved must not hang on it
+                try:
+                    SendNotification(NotificationType.Error, f"Error saving game files data: {e}")
+                except Exception:
+                    pass
+            finally:
+                with self._saveLock:
+                    if self._saveSnapshot is None:
+                        self._saved.set()
+
+    def hashGameFile(self, path: str) -> str:
+        # Unchanged mtime and size - trust the stored hash and skip reading the file
+        stat = os.stat(path)
+        cached = self.filesStat.get(path)
+
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        fileHash = HashFile(path)
+        with self._indexLock:
+            self.filesStat[path] = [stat.st_mtime_ns, stat.st_size, fileHash]
+
+        return fileHash
+
+    def rememberGameFile(self, path: str, fileHash: str):
+        stat = os.stat(path)
+        with self._indexLock:
+            self.filesStat[path] = [stat.st_mtime_ns, stat.st_size, fileHash]
+
+    def installFile(self, fileName: str, modFileContent: bytes, modHash: str):
+        # InstallingModFile is sent by the caller; debug output of a file goes out in one channel write
+        debug = [(NotificationType.Debug, f"🔧 GAMEFILES: Installing file: {fileName}"),
+                 (NotificationType.Debug, f"🔧 GAMEFILES: File size: {len(modFileContent)} bytes"),
+                 (NotificationType.Debug, f"🔧 GAMEFILES: Mod hash: {modHash}")]
+        try:
+            self._installFile(fileName, modFileContent, modHash, debug)
+        finally:
+            SendNotifications(debug)
+
+    def _installFile(self, fileName: str, modFileContent: bytes, modHash: str, debug: list):
         # Check if file is in BRAWLHALLA_FILES or BRAWLHALLA_SWFS (for SWF files)
         target_path = None
         if fileName in BRAWLHALLA_FILES:
             target_path = BRAWLHALLA_FILES[fileName]
-            SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: File found in BRAWLHALLA_FILES: {fileName}")
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: File found in BRAWLHALLA_FILES: {fileName}"))
         elif fileName in BRAWLHALLA_SWFS:
             target_path = BRAWLHALLA_SWFS[fileName]
-            SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: File found in BRAWLHALLA_SWFS: {fileName}")
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: File found in BRAWLHALLA_SWFS: {fileName}"))
         
         if target_path:
-            SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Target path: {target_path}")
-            
-            with open(target_path, "rb") as file:
-                origFileContent = file.read()
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Target path: {target_path}"))
 
-            origFileHash = HashFromBytes(origFileContent)
-            modFileHash = HashFromBytes(modFileContent)
-            
-            SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Original file hash: {origFileHash}")
-            SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Mod file hash: {modFileHash}")
-            SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Hashes match: {origFileHash == modFileHash}")
+            # Files of one install session may run in parallel, see InstallSession
+            with self._pathLock(target_path):
+                self._installGameFile(fileName, target_path, modFileContent, modHash, debug)
+
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Installation completed for: {fileName}"))
+        else:
+            debug.append((NotificationType.Debug, f"❌ GAMEFILES: File not found in BRAWLHALLA_FILES or BRAWLHALLA_SWFS: {fileName}"))
+            debug.append((NotificationType.Debug, f"❌ GAMEFILES: Available files: {list(BRAWLHALLA_FILES.keys())[:10]}..."))
+            debug.append((NotificationType.Debug, f"❌ GAMEFILES: Available SWF files: {list(BRAWLHALLA_SWFS.keys())[:10]}..."))
 
-            copyOrigFile = True
+        pass
+
+    def _installGameFile(self, fileName: str, target_path: str, modFileContent: bytes, modHash: str, debug: list):
+        origFileHash = self.hashGameFile(target_path)
+        modFileHash = HashFromBytes(modFileContent)
+        
+        debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Original file hash: {origFileHash}"))
+        debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Mod file hash: {modFileHash}"))
+        debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Hashes match: {origFileHash == modFileHash}"))
 
+        copyOrigFile = True
+
+        with self._indexLock:
             if fileName not in self.origFiles:
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: File not in origFiles cache - caching")
+                debug.append((NotificationType.Debug, f"🔧 GAMEFILES: File not in origFiles cache - caching"))
                 self.origFiles[fileName] = origFileHash
             elif fileName not in self.modFiles and self.origFiles[fileName] != origFileHash:
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Original file changed - updating cache")
+                debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Original file changed - updating cache"))
                 self.origFiles[fileName] = origFileHash
             elif fileName in self.modFiles and origFileHash not in (self.origFiles[fileName], self.modFiles[fileName]):
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: File modified - updating cache")
+                debug.append((NotificationType.Debug, f"🔧 GAMEFILES: File modified - updating cache"))
                 self.origFiles[fileName] = origFileHash
             else:
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: No cache update needed")
+                debug.append((NotificationType.Debug, f"🔧 GAMEFILES: No cache update needed"))
                 copyOrigFile = False
 
-            if copyOrigFile:
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Copying original file to cache")
-                SendNotification(NotificationType.InstallingModFileCache, modHash, fileName)
-                # Use basename for cache file to avoid directory structure issues
-                cache_filename = os.path.basename(fileName)
-                cache_path = os.path.join(self.origPreviewsPath, cache_filename)
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Cache path: {cache_path}")
-                
-                with open(cache_path, "wb") as copyFile:
-                    copyFile.write(origFileContent)
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Original file cached successfully")
-
-            if origFileHash != modFileHash:
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Replacing original file with mod file")
-                with open(target_path, "wb") as modFile:
-                    modFile.write(modFileContent)
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: File replaced successfully")
-            else:
-                SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: File unchanged - no replacement needed")
+        if copyOrigFile:
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Copying original file to cache"))
+            SendNotification(NotificationType.InstallingModFileCache, modHash, fileName)
+            # Use basename for cache file to avoid directory structure issues
+            cache_filename = os.path.basename(fileName)
+            cache_path = os.path.join(self.origPreviewsPath, cache_filename)
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Cache path: {cache_path}"))
+            
+            with self._pathLock(cache_path):
+                # Size mismatch rules out a match without hashing the cached file
+                cachedStat = self._origCacheIndex.get(cache_filename)
+                if (cachedStat is not None and cachedStat.st_size == os.stat(target_path).st_size
+                        and self.hashGameFile(cache_path) == origFileHash):
+                    debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Cached original already up to date"))
+                else:
+                    shutil.copyfile(target_path, cache_path)
+                    self.rememberGameFile(cache_path, origFileHash)
+                    self._origCacheIndex[cache_filename] = os.stat(cache_path)
+                    debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Original file cached successfully"))
+
+        if origFileHash != modFileHash:
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Replacing original file with mod file"))
+            with open(target_path, "wb") as modFile:
+                modFile.write(modFileContent)
+            self.rememberGameFile(target_path, modFileHash)
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: File replaced successfully"))
+        else:
+            debug.append((NotificationType.Debug, f"🔧 GAMEFILES: File unchanged - no replacement needed"))
 
+        with self._indexLock:
             self.modFiles[fileName] = modFileHash
             self.modifiedFilesMap[fileName] = modHash
-            
-            SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Updated mod tracking - modFiles: {self.modFiles.get(fileName)}, modifiedFilesMap: {self.modifiedFilesMap.get(fileName)}")
+            self._dirty = True
+        
+        debug.append((NotificationType.Debug, f"🔧 GAMEFILES: Updated mod tracking - modFiles: {modFileHash}, modifiedFilesMap: {modHash}"))
 
+    def flush(self):
+        """Save index once after a batch of installFile calls"""
+        if self._dirty:
+            self._dirty = False
             self.saveData()
-            SendNotification(NotificationType.Debug, f"🔧 GAMEFILES: Installation completed for: {fileName}")
-        else:
-            SendNotification(NotificationType.Debug, f"❌ GAMEFILES: File not found in BRAWLHALLA_FILES or BRAWLHALLA_SWFS: {fileName}")
-            SendNotification(NotificationType.Debug, f"❌ GAMEFILES: Available files: {list(BRAWLHALLA_FILES.keys())[:10]}...")
-            SendNotification(NotificationType.Debug, f"❌ GAMEFILES: Available SWF files: {list(BRAWLHALLA_SWFS.keys())[:10]}...")
 
-        pass
+    @contextmanager
+    def installSession(self, onError: Optional[Callable[[str, Exception], None]] = None):
+        """Group installFile calls of one mod on a thread pool, index is flushed on exit"""
+        session = InstallSession(self, onError)
+        try:
+            yield session
+            session.wait()
+        finally:
+            session.close()
+            self.flush()
+
+    def _pathLock(self, path: str) -> threading.Lock:
+        with self._indexLock:
+            return self._pathLocks.setdefault(path, threading.Lock())
 
     def repairFile(self, fileName: str):
         if fileName in self.origFiles:
             # Use basename for cache file lookup
             cache_filename = os.path.basename(fileName)
-            with open(os.path.join(self.origPreviewsPath, cache_filename), "rb") as copyFile:
-                origFileContent = copyFile.read()
+            cache_path = os.path.join(self.origPreviewsPath, cache_filename)
 
             # Check if file is in BRAWLHALLA_FILES or BRAWLHALLA_SWFS (for SWF files)
             target_path = None
@@ -138,19 +322,25 @@ class GameFilesClass(GameFilesData):
                 target_path = BRAWLHALLA_SWFS[fileName]
             
             if target_path:
-                with open(target_path, "wb") as file:
-                    file.write(origFileContent)
+                shutil.copyfile(cache_path, target_path)
+                with self._indexLock:
+                    self.filesStat.pop(target_path, None)
 
             self.modFiles.pop(fileName, None)
             self.modifiedFilesMap.pop(fileName, None)
 
     def uninstallMod(self, modHash: str):
+        notifications = []
+
         for fileName, fileModHash in self.modifiedFilesMap.copy().items():
             if fileModHash == modHash:
                 #print("Восстановление файла", fileName)
-                SendNotification(NotificationType.UninstallingModFile, modHash, fileName)
+                notifications.append((NotificationType.UninstallingModFile, modHash, fileName))
                 self.repairFile(fileName)
 
+        SendNotifications(notifications)
+
+        self._dirty = False
         self.saveData()
 
     def getModConflict(self, files: List[str], modHash: str):
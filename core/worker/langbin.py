@@ -12,11 +12,19 @@ from ..utils.hash import HashFile
 
 # Import DecodeLang functionality
 import zlib
+import struct
 import re
 import codecs
 import time
 
 
+UINT32BE = struct.Struct(">I")
+UINT16BE = struct.Struct(">H")
+
+# Fastest deflate level, lang files are rewritten on every language mod change
+LANG_COMPRESS_LEVEL = 1
+
+
 class ByteReader:
     @staticmethod
     def ReadUint32BE(data: io.BytesIO) -> int:
@@ -87,15 +95,24 @@ class LangFile:
 
     # public
     def Save(self, filename: str) -> None:
-        data: io.BytesIO = io.BytesIO()
-        data.write(self.__WriteUint32BE(self.entry_count))
-        for entry in self.entries:
-            entry.WriteBytesIO(data)
+        strings = [string.encode("utf-8")
+                   for entry in self.entries
+                   for string in (entry.key.string, entry.value.string)]
+
+        data = bytearray(4 + 2 * len(strings) + sum(map(len, strings)))
+        UINT32BE.pack_into(data, 0, self.entry_count)
+        offset = 4
+        for string in strings:
+            UINT16BE.pack_into(data, offset, len(string))
+            offset += 2
+            data[offset:offset + len(string)] = string
+            offset += len(string)
 
         with open(filename, "wb") as fd:
-            self.inflated_size = data.getbuffer().nbytes
+            self.inflated_size = len(data)
             fd.write(self.inflated_size.to_bytes(4, byteorder="little"))
-            self.zlibdata = zlib.compress(data.getbuffer())
+            compressor = zlib.compressobj(LANG_COMPRESS_LEVEL, zlib.DEFLATED, 15)
+            self.zlibdata = compressor.compress(data) + compressor.flush()
             fd.write(self.zlibdata)
 
     def Dump(self, filename: str) -> None:
@@ -126,31 +143,41 @@ class LangFile:
 
     # private
     def __ParseFile(self) -> None:
-        self.data: io.BytesIO = io.BytesIO(zlib.decompress(self.zlibdata))
-        self.entry_count: int = ByteReader.ReadUint32BE(self.data)
+        data = memoryview(zlib.decompress(self.zlibdata))
+        self.entry_count: int = UINT32BE.unpack_from(data, 0)[0]
+        offset = 4
+
+        # Entries are flat pairs of length-prefixed key and value strings
+        strings = []
+        for _ in range(self.entry_count * 2):
+            length = UINT16BE.unpack_from(data, offset)[0]
+            offset += 2
+            strings.append(UTF8String(length, str(data[offset:offset + length], "utf-8")))
+            offset += length
 
-        while len(self.entries) < self.entry_count:
-            self.entries.append(Entry.FromBytesIO(self.data))
+        self.entries = [Entry(key, value) for key, value in zip(strings[::2], strings[1::2])]
 
-    def __WriteUint32BE(self, number: int) -> bytes:
-        return number.to_bytes(4, byteorder="big")
+        # Reversed, so the first entry wins for duplicated keys like a linear search would
+        self._index: Dict[str, Entry] = {entry.key.string: entry for entry in reversed(self.entries)}
 
     # overrides
     def __setitem__(self, key: str, value: str) -> None:
         # Check if entry exists and update if it does
-        for entry in self.entries:
-            if entry.key.string == key:
-                entry.SetValue(value)
-                return
+        entry = self._index.get(key)
+        if entry is not None:
+            entry.SetValue(value)
+            return
         
         # Add new entry if not found
-        self.entries.append(Entry.FromKeyValuePair(key, value))
+        entry = Entry.FromKeyValuePair(key, value)
+        self.entries.append(entry)
+        self._index[key] = entry
         self.entry_count += 1
 
     def __getitem__(self, key: str) -> Optional[str]:
-        for entry in self.entries:
-            if entry.key.string == key:
-                return entry.value.string
+        entry = self._index.get(key)
+        if entry is not None:
+            return entry.value.string
         return None
 
 
@@ -218,6 +245,7 @@ class LangBinHandler:
                 # Handle .txt file - create a temporary LangFile and load from text
                 mod_lang_file = LangFile.__new__(LangFile)  # Create instance without calling __init__
                 mod_lang_file.entries = []
+                mod_lang_file._index = {}
                 mod_lang_file.entry_count = 0
                 mod_lang_file.inflated_size = b''
                 mod_lang_file.zlibdata = b''
@@ -835,225 +835,227 @@ class ModClass(ModCache):
         print(f"📁 Files in mod: {list(self.files.values())}")
         print(f"📁 Files in mod (detailed): {self.files}")
         
-        for elId, fileName in self.files.items():
-            # Update progress for file processing
-            processed_files += 1
-            SendNotification(NotificationType.InstallingModFile, self.hash, fileName)
+        # GameFiles index is saved once after all files are installed
+        with GameFiles.installSession() as session:
+            for elId, fileName in self.files.items():
+                # Update progress for file processing
+                processed_files += 1
+                SendNotification(NotificationType.InstallingModFile, self.hash, fileName)
             
-            # Add comprehensive debug logging
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Processing file {processed_files}/{total_files}: {fileName}")
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: File ID: {elId}, File Name: {fileName}")
+                # Add comprehensive debug logging
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Processing file {processed_files}/{total_files}: {fileName}")
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: File ID: {elId}, File Name: {fileName}")
             
-            fileElement = self.modSwf.getElementById(elId)
-            if fileElement:
-                fileElement = fileElement[0]
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Found file element for {fileName}")
-            else:
-                SendNotification(NotificationType.Debug, f"❌ INSTALL: ERROR - Not found element '{elId}' for file '{fileName}'")
-                SendNotification(NotificationType.InstallingModNotFoundFileElement, self.hash, elId)
-                continue
+                fileElement = self.modSwf.getElementById(elId)
+                if fileElement:
+                    fileElement = fileElement[0]
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Found file element for {fileName}")
+                else:
+                    SendNotification(NotificationType.Debug, f"❌ INSTALL: ERROR - Not found element '{elId}' for file '{fileName}'")
+                    SendNotification(NotificationType.InstallingModNotFoundFileElement, self.hash, elId)
+                    continue
 
-            # Add progress update before heavy operation
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Exporting binary data for {fileName}")
-            file_data = self.modSwf.exportBinaryData(fileElement)
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Exported {len(file_data)} bytes for {fileName}")
+                # Add progress update before heavy operation
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Exporting binary data for {fileName}")
+                file_data = self.modSwf.exportBinaryData(fileElement)
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Exported {len(file_data)} bytes for {fileName}")
             
-            # Log file info
-            with open(os.path.join(log_dir, "mod_installation.txt"), "a", encoding="utf-8") as log_file:
-                log_file.write(f"Processing file: {fileName}, Size: {len(file_data)} bytes\n")
+                # Log file info
+                with open(os.path.join(log_dir, "mod_installation.txt"), "a", encoding="utf-8") as log_file:
+                    log_file.write(f"Processing file: {fileName}, Size: {len(file_data)} bytes\n")
             
-            # Check if this is a language file (.bin or .txt)
-            # Handle both direct files (language.1.bin) and files in folders (languages/language.1.bin)
-            is_language_file = (
-                ("language." in fileName and fileName.endswith(".bin")) or 
-                fileName.endswith("_language.txt")
-            )
+                # Check if this is a language file (.bin or .txt)
+                # Handle both direct files (language.1.bin) and files in folders (languages/language.1.bin)
+                is_language_file = (
+                    ("language." in fileName and fileName.endswith(".bin")) or 
+                    fileName.endswith("_language.txt")
+                )
             
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Processing file: {fileName}")
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Is language file: {is_language_file}")
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: File starts with 'language.': {fileName.startswith('language.')}")
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: File ends with '.bin': {fileName.endswith('.bin')}")
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: File ends with '_language.txt': {fileName.endswith('_language.txt')}")
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Contains 'language.': {'language.' in fileName}")
-            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Detection logic result: {('language.' in fileName and fileName.endswith('.bin')) or fileName.endswith('_language.txt')}")
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Processing file: {fileName}")
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Is language file: {is_language_file}")
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: File starts with 'language.': {fileName.startswith('language.')}")
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: File ends with '.bin': {fileName.endswith('.bin')}")
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: File ends with '_language.txt': {fileName.endswith('_language.txt')}")
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Contains 'language.': {'language.' in fileName}")
+                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Detection logic result: {('language.' in fileName and fileName.endswith('.bin')) or fileName.endswith('_language.txt')}")
             
-            if is_language_file:
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** LANGUAGE FILE DETECTED ***")
-                SendNotification(NotificationType.Debug, f"Found language file: {fileName} in mod {self.hash}")
-                has_language_bin = True
-                language_files_processed.append(fileName)
+                if is_language_file:
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** LANGUAGE FILE DETECTED ***")
+                    SendNotification(NotificationType.Debug, f"Found language file: {fileName} in mod {self.hash}")
+                    has_language_bin = True
+                    language_files_processed.append(fileName)
                 
-                # Handle language file with specialized handler
-                from .langbin import lang_bin_handler
+                    # Handle language file with specialized handler
+                    from .langbin import lang_bin_handler
                 
-                # Create a debug message
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Calling language handler for: {fileName}")
+                    # Create a debug message
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Calling language handler for: {fileName}")
                 
-                # Save file to a temporary location with a unique name to avoid conflicts
-                import uuid
-                temp_id = str(uuid.uuid4())[:8]
-                # Extract just the filename from the path to avoid directory issues
-                filename_only = os.path.basename(fileName)
-                temp_file_path = os.path.join(MODLOADER_CACHE_PATH, f"temp_{temp_id}_{filename_only}")
+                    # Save file to a temporary location with a unique name to avoid conflicts
+                    import uuid
+                    temp_id = str(uuid.uuid4())[:8]
+                    # Extract just the filename from the path to avoid directory issues
+                    filename_only = os.path.basename(fileName)
+                    temp_file_path = os.path.join(MODLOADER_CACHE_PATH, f"temp_{temp_id}_{filename_only}")
                 
-                try:
-                    # Write the file data to the temporary file
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Writing language file to temp: {temp_file_path}")
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Original filename: {fileName}, Extracted filename: {filename_only}")
-                    with open(temp_file_path, "wb") as tmp_file:
-                        tmp_file.write(file_data)
-                    
-                    # Process the language file and apply its changes
                     try:
-                        # Add original file name as a parameter to help match the correct game file
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Calling apply_mod_language_changes with file: {fileName}")
-                        success = lang_bin_handler.apply_mod_language_changes(temp_file_path, self.hash, original_filename=filename_only)
+                        # Write the file data to the temporary file
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Writing language file to temp: {temp_file_path}")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Original filename: {fileName}, Extracted filename: {filename_only}")
+                        with open(temp_file_path, "wb") as tmp_file:
+                            tmp_file.write(file_data)
+                    
+                        # Process the language file and apply its changes
+                        try:
+                            # Add original file name as a parameter to help match the correct game file
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Calling apply_mod_language_changes with file: {fileName}")
+                            success = lang_bin_handler.apply_mod_language_changes(temp_file_path, self.hash, original_filename=filename_only)
                         
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Language handler result: {success}")
-                        if success:
-                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Language.txt result: True")
-                            SendNotification(NotificationType.Success, f"Successfully applied language changes from {fileName}")
-                        else:
-                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Language.txt result: False")
-                            SendNotification(NotificationType.Error, f"Failed to apply language changes from {fileName}")
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Language handler result: {success}")
+                            if success:
+                                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Language.txt result: True")
+                                SendNotification(NotificationType.Success, f"Successfully applied language changes from {fileName}")
+                            else:
+                                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Language.txt result: False")
+                                SendNotification(NotificationType.Error, f"Failed to apply language changes from {fileName}")
+                        except Exception as e:
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Language.txt error: {str(e)}")
+                            SendNotification(NotificationType.Error, f"Error processing language file: {str(e)}")
                     except Exception as e:
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Language.txt error: {str(e)}")
-                        SendNotification(NotificationType.Error, f"Error processing language file: {str(e)}")
-                except Exception as e:
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Error saving temp language file: {str(e)}")
-                    SendNotification(NotificationType.Error, f"Error saving temporary language file: {str(e)}")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Error saving temp language file: {str(e)}")
+                        SendNotification(NotificationType.Error, f"Error saving temporary language file: {str(e)}")
                 
-                # Clean up the temporary file
-                if os.path.exists(temp_file_path):
-                    try:
-                        os.remove(temp_file_path)
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Cleaned up temp language file: {temp_file_path}")
-                    except Exception as e:
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Error removing temp language file: {str(e)}")
-                        with open(os.path.join(log_dir, "mod_installation.txt"), "a", encoding="utf-8") as log_file:
-                            log_file.write(f"Error removing temporary file: {str(e)}\n")
+                    # Clean up the temporary file
+                    if os.path.exists(temp_file_path):
+                        try:
+                            os.remove(temp_file_path)
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Cleaned up temp language file: {temp_file_path}")
+                        except Exception as e:
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Error removing temp language file: {str(e)}")
+                            with open(os.path.join(log_dir, "mod_installation.txt"), "a", encoding="utf-8") as log_file:
+                                log_file.write(f"Error removing temporary file: {str(e)}\n")
             
-            # Check if this is a .bnk file
-            elif fileName.endswith(".bnk"):
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** BNK FILE DETECTED ***")
-                has_bnk_files = True
-                bnk_files_processed.append(fileName)
+                # Check if this is a .bnk file
+                elif fileName.endswith(".bnk"):
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** BNK FILE DETECTED ***")
+                    has_bnk_files = True
+                    bnk_files_processed.append(fileName)
                 
-                # Handle .bnk file with specialized handler
-                SendNotification(NotificationType.Debug, f"Found .bnk file in mod: {fileName}")
+                    # Handle .bnk file with specialized handler
+                    SendNotification(NotificationType.Debug, f"Found .bnk file in mod: {fileName}")
                 
-                # Save file to a temporary location
-                # Extract just the filename from the path to avoid directory issues
-                filename_only = os.path.basename(fileName)
-                temp_file_path = os.path.join(MODLOADER_CACHE_PATH, f"temp_{filename_only}")
-                try:
-                    # Write the binary data to the temporary file
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Writing BNK file to temp: {temp_file_path}")
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Original filename: {fileName}, Extracted filename: {filename_only}")
-                    with open(temp_file_path, "wb") as tmp_file:
-                        tmp_file.write(file_data)
+                    # Save file to a temporary location
+                    # Extract just the filename from the path to avoid directory issues
+                    filename_only = os.path.basename(fileName)
+                    temp_file_path = os.path.join(MODLOADER_CACHE_PATH, f"temp_{filename_only}")
+                    try:
+                        # Write the binary data to the temporary file
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Writing BNK file to temp: {temp_file_path}")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Original filename: {fileName}, Extracted filename: {filename_only}")
+                        with open(temp_file_path, "wb") as tmp_file:
+                            tmp_file.write(file_data)
                     
-                    # Process the .bnk file and apply its changes
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Calling BNK handler for: {fileName}")
-                    success = bnk_handler.apply_mod_changes(temp_file_path, self.hash, filename_only)
+                        # Process the .bnk file and apply its changes
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Calling BNK handler for: {fileName}")
+                        success = bnk_handler.apply_mod_changes(temp_file_path, self.hash, filename_only)
                     
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: BNK handler result: {success}")
-                    if success:
-                        SendNotification(NotificationType.Success, f"Successfully applied BNK changes from {fileName}")
-                    else:
-                        SendNotification(NotificationType.Error, f"Failed to apply BNK changes from {fileName}")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: BNK handler result: {success}")
+                        if success:
+                            SendNotification(NotificationType.Success, f"Successfully applied BNK changes from {fileName}")
+                        else:
+                            SendNotification(NotificationType.Error, f"Failed to apply BNK changes from {fileName}")
                         
-                except Exception as e:
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: BNK processing error: {str(e)}")
-                    SendNotification(NotificationType.Error, f"Error processing BNK file: {str(e)}")
-                    
-                # Clean up the temporary file
-                if os.path.exists(temp_file_path):
-                    try:
-                        os.remove(temp_file_path)
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Cleaned up temp BNK file: {temp_file_path}")
                     except Exception as e:
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Error removing temp BNK file: {str(e)}")
-                        with open(os.path.join(log_dir, "mod_installation.txt"), "a", encoding="utf-8") as log_file:
-                            log_file.write(f"Error removing temporary BNK file: {str(e)}\n")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: BNK processing error: {str(e)}")
+                        SendNotification(NotificationType.Error, f"Error processing BNK file: {str(e)}")
+                    
+                    # Clean up the temporary file
+                    if os.path.exists(temp_file_path):
+                        try:
+                            os.remove(temp_file_path)
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Cleaned up temp BNK file: {temp_file_path}")
+                        except Exception as e:
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Error removing temp BNK file: {str(e)}")
+                            with open(os.path.join(log_dir, "mod_installation.txt"), "a", encoding="utf-8") as log_file:
+                                log_file.write(f"Error removing temporary BNK file: {str(e)}\n")
             
-            # Check if this is a .wem file
-            elif fileName.endswith(".wem"):
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** WEM FILE DETECTED ***")
-                has_wem_files = True
-                wem_files_processed.append(fileName)
-                SendNotification(NotificationType.Debug, f"Found .wem file in mod: {fileName}")
+                # Check if this is a .wem file
+                elif fileName.endswith(".wem"):
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** WEM FILE DETECTED ***")
+                    has_wem_files = True
+                    wem_files_processed.append(fileName)
+                    SendNotification(NotificationType.Debug, f"Found .wem file in mod: {fileName}")
                 
-                # Handle .wem file with specialized handler
-                # Determine the target BNK file based on folder structure
-                filename_only = os.path.basename(fileName)
-                target_bnk_file = None
+                    # Handle .wem file with specialized handler
+                    # Determine the target BNK file based on folder structure
+                    filename_only = os.path.basename(fileName)
+                    target_bnk_file = None
                 
-                # If the fileName contains folder structure (e.g., "sounds/001.wem"), 
-                # try to find the matching BNK file
-                if "/" in fileName:
-                    folder_name = fileName.split("/")[0]
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: WEM file in folder: {folder_name}")
+                    # If the fileName contains folder structure (e.g., "sounds/001.wem"), 
+                    # try to find the matching BNK file
+                    if "/" in fileName:
+                        folder_name = fileName.split("/")[0]
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: WEM file in folder: {folder_name}")
                     
-                    # Look for BNK files that might match this folder
-                    for game_file, game_path in BRAWLHALLA_FILES.items():
-                        if game_file.endswith(".bnk") and folder_name.lower() in game_path.lower():
-                            target_bnk_file = game_file
-                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Found matching BNK: {target_bnk_file}")
-                            break
+                        # Look for BNK files that might match this folder
+                        for game_file, game_path in BRAWLHALLA_FILES.items():
+                            if game_file.endswith(".bnk") and folder_name.lower() in game_path.lower():
+                                target_bnk_file = game_file
+                                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Found matching BNK: {target_bnk_file}")
+                                break
                 
-                # If no specific BNK found, use the filename as fallback
-                if target_bnk_file is None:
-                    target_bnk_file = filename_only
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Using filename as BNK target: {target_bnk_file}")
+                    # If no specific BNK found, use the filename as fallback
+                    if target_bnk_file is None:
+                        target_bnk_file = filename_only
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Using filename as BNK target: {target_bnk_file}")
                 
-                # Save file to a temporary location
-                temp_file_path = os.path.join(MODLOADER_CACHE_PATH, f"temp_{filename_only}")
-                try:
-                    # Write the binary data to the temporary file
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Writing WEM file to temp: {temp_file_path}")
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Original filename: {fileName}, Extracted filename: {filename_only}")
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Target BNK file: {target_bnk_file}")
-                    with open(temp_file_path, "wb") as tmp_file:
-                        tmp_file.write(file_data)
+                    # Save file to a temporary location
+                    temp_file_path = os.path.join(MODLOADER_CACHE_PATH, f"temp_{filename_only}")
+                    try:
+                        # Write the binary data to the temporary file
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Writing WEM file to temp: {temp_file_path}")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Original filename: {fileName}, Extracted filename: {filename_only}")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Target BNK file: {target_bnk_file}")
+                        with open(temp_file_path, "wb") as tmp_file:
+                            tmp_file.write(file_data)
                     
-                    # Process the .wem file and apply its changes
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Calling WEM handler for: {fileName}")
-                    success = bnk_handler.apply_wem_file(temp_file_path, self.hash, target_bnk_file)
+                        # Process the .wem file and apply its changes
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Calling WEM handler for: {fileName}")
+                        success = bnk_handler.apply_wem_file(temp_file_path, self.hash, target_bnk_file)
                     
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: WEM handler result: {success}")
-                    if success:
-                        SendNotification(NotificationType.Success, f"Successfully applied WEM changes from {fileName} to {target_bnk_file}")
-                    else:
-                        SendNotification(NotificationType.Error, f"Failed to apply WEM changes from {fileName} to {target_bnk_file}")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: WEM handler result: {success}")
+                        if success:
+                            SendNotification(NotificationType.Success, f"Successfully applied WEM changes from {fileName} to {target_bnk_file}")
+                        else:
+                            SendNotification(NotificationType.Error, f"Failed to apply WEM changes from {fileName} to {target_bnk_file}")
                         
-                except Exception as e:
-                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: WEM processing error: {str(e)}")
-                    SendNotification(NotificationType.Error, f"Error processing WEM file: {str(e)}")
-                    
-                # Clean up the temporary file
-                if os.path.exists(temp_file_path):
-                    try:
-                        os.remove(temp_file_path)
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Cleaned up temp WEM file: {temp_file_path}")
                     except Exception as e:
-                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: Error removing temp WEM file: {str(e)}")
-                        with open(os.path.join(log_dir, "mod_installation.txt"), "a", encoding="utf-8") as log_file:
-                            log_file.write(f"Error removing temporary WEM file: {str(e)}\n")
-            # Check if this is a full .swf file replacement
-            elif fileName.endswith(".swf") and fileName in BRAWLHALLA_SWFS:
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** FULL SWF FILE REPLACEMENT DETECTED ***")
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Installing full SWF file: {fileName}")
-                # Install the full SWF file directly using GameFiles
-                GameFiles.installFile(fileName, file_data, self.hash)
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Completed full SWF file installation: {fileName}")
+                        SendNotification(NotificationType.Debug, f"🔧 INSTALL: WEM processing error: {str(e)}")
+                        SendNotification(NotificationType.Error, f"Error processing WEM file: {str(e)}")
+                    
+                    # Clean up the temporary file
+                    if os.path.exists(temp_file_path):
+                        try:
+                            os.remove(temp_file_path)
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Cleaned up temp WEM file: {temp_file_path}")
+                        except Exception as e:
+                            SendNotification(NotificationType.Debug, f"🔧 INSTALL: Error removing temp WEM file: {str(e)}")
+                            with open(os.path.join(log_dir, "mod_installation.txt"), "a", encoding="utf-8") as log_file:
+                                log_file.write(f"Error removing temporary WEM file: {str(e)}\n")
+                # Check if this is a full .swf file replacement
+                elif fileName.endswith(".swf") and fileName in BRAWLHALLA_SWFS:
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** FULL SWF FILE REPLACEMENT DETECTED ***")
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Installing full SWF file: {fileName}")
+                    # Install the full SWF file directly using GameFiles
+                    session.installFile(fileName, file_data, self.hash)
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Queued full SWF file installation: {fileName}")
             
-            else:
-                # Regular file installation (including images)
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** REGULAR FILE DETECTED ***")
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Installing regular file: {fileName}")
-                GameFiles.installFile(fileName, file_data, self.hash)
-                SendNotification(NotificationType.Debug, f"🔧 INSTALL: Completed regular file installation: {fileName}")
+                else:
+                    # Regular file installation (including images)
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: *** REGULAR FILE DETECTED ***")
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Installing regular file: {fileName}")
+                    session.installFile(fileName, file_data, self.hash)
+                    SendNotification(NotificationType.Debug, f"🔧 INSTALL: Queued regular file installation: {fileName}")
         
         # Process SWF files with progress tracking
         total_swfs = len(self.swfs)
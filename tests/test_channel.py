@@ -0,0 +1,98 @@
+import os
+import sys
+import queue
+import threading
+import multiprocessing
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core", "controller"))
+
+from channel import ShmChannel, OutOfBand  # noqa: E402
+
+
+ARENA = 4096
+
+
+@pytest.fixture
+def channel():
+    channel = ShmChannel(ARENA)
+    yield channel
+    channel.close()
+
+
+def _putLarge(channel, payload):
+    channel.put(payload)
+    channel.put("after")
+
+
+def test_roundtrip_wraps_arena(channel):
+    for index in range(200):
+        message = (index, os.urandom(index * 7 % 700))
+        channel.put(message)
+        assert channel.get() == message
+
+    assert channel.empty()
+
+
+def test_put_many(channel):
+    channel.put_many([("batch", index) for index in range(20)])
+    assert [channel.get() for _ in range(20)] == [("batch", index) for index in range(20)]
+
+
+def test_out_of_band_loads_as_bytes(channel):
+    payload = os.urandom(3000)
+    channel.put(OutOfBand((payload,)))
+
+    loaded = channel.get()
+    assert loaded == (payload,) and type(loaded[0]) is bytes
+
+
+def test_full_raises(channel):
+    channel.put(b"x" * 3000, False)
+
+    with pytest.raises(queue.Full):
+        channel.put(b"y" * 3000, False)
+    with pytest.raises(queue.Full):
+        channel.put(b"y" * 3000, timeout=0.05)
+
+    assert channel.get() == b"x" * 3000
+    with pytest.raises(queue.Empty):
+        channel.get(False)
+
+
+def test_stream_larger_than_arena_thread(channel):
+    payload = os.urandom(5 * ARENA)
+    producer = threading.Thread(target=_putLarge, args=(channel, payload))
+    producer.start()
+
+    assert channel.get(timeout=10) == payload
+    assert channel.get(timeout=10) == "after"
+    producer.join(10)
+    assert not producer.is_alive()
+
+
+def test_stream_larger_than_arena_process(channel):
+    payload = os.urandom(5 * ARENA)
+    producer = multiprocessing.Process(target=_putLarge, args=(channel, payload))
+    producer.start()
+
+    assert channel.get(timeout=30) == payload
+    assert channel.get(timeout=30) == "after"
+    producer.join(30)
+    assert producer.exitcode == 0
+
+
+def test_stream_without_consumer(channel):
+    payload = os.urandom(5 * ARENA)
+
+    with pytest.raises(queue.Full):
+        channel.put(payload, False)
+
+    # Withdrawn on timeout, the channel stays usable
+    with pytest.raises(queue.Full):
+        channel.put(payload, timeout=0.1)
+    assert not channel.poll(0)
+
+    channel.put("small")
+    assert channel.get() == "small"
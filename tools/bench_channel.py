@@ -0,0 +1,52 @@
+"""
+Compare ShmChannel with multiprocessing.Queue: a spawned process sends small
+messages, the parent receives them.
+
+    python tools/bench_channel.py [messages]
+"""
+import os
+import sys
+import time
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core", "controller"))
+
+from channel import ShmChannel  # noqa: E402
+
+
+MESSAGE = (1, "x" * 80)
+BATCH = 100
+
+
+def produce(channel, count):
+    for _ in range(count):
+        channel.put(MESSAGE)
+
+
+def produceMany(channel, count):
+    batch = [MESSAGE] * BATCH
+    for _ in range(count // BATCH):
+        channel.put_many(batch)
+
+
+def measure(channel, producer, count):
+    process = multiprocessing.Process(target=producer, args=(channel, count))
+    start = time.perf_counter()
+    process.start()
+    for _ in range(count):
+        channel.get()
+    elapsed = time.perf_counter() - start
+    process.join()
+    return elapsed
+
+
+if __name__ == "__main__":
+    multiprocessing.set_start_method("spawn")
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"multiprocessing.Queue   {measure(multiprocessing.Queue(), produce, count):.2f} s")
+
+    for name, producer in (("ShmChannel.put", produce), ("ShmChannel.put_many", produceMany)):
+        channel = ShmChannel()
+        print(f"{name:<23} {measure(channel, producer, count):.2f} s")
+        channel.close()